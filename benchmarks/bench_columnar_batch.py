@@ -1,18 +1,58 @@
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
+import os
 import shutil
 import tempfile
 import time
 from pathlib import Path
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pyrex
 
 
+def zero_padded_digits(rows: int, width: int) -> np.ndarray:
+    """Formats ``0..rows-1`` as ASCII digits, one ``uint8`` row of ``width`` bytes per index."""
+    indices = np.arange(rows, dtype=np.int64)[:, None]
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (indices // powers % 10 + ord("0")).astype(np.uint8)
+
+
+def with_prefix(prefix: bytes, digits: np.ndarray) -> np.ndarray:
+    """Prepends ``prefix`` to every digit row and returns a fixed-width ``S`` array."""
+    head = np.broadcast_to(np.frombuffer(prefix, dtype=np.uint8), (digits.shape[0], len(prefix)))
+    rows = np.concatenate([head, digits], axis=1)
+    return np.ascontiguousarray(rows).view(f"S{rows.shape[1]}").ravel()
+
+
+def key_width(rows: int) -> int:
+    return max(8, len(str(rows)))
+
+
+def make_key(i: int, width: int) -> bytes:
+    # bytes.__mod__ formats straight to bytes in C; no str round-trip or .encode().
+    return b"k%0*d" % (width, i)
+
+
+def make_value(i: int, width: int) -> bytes:
+    return b"value-%0*d" % (width, i)
+
+
 def make_data(rows: int):
-    width = max(8, len(str(rows)))
-    keys = [f"k{i:0{width}d}".encode() for i in range(rows)]
-    values = [f"value-{i:0{width}d}".encode() for i in range(rows)]
-    return keys, values, pa.array(keys, type=pa.binary()), pa.array(values, type=pa.binary())
+    width = key_width(rows)
+    # Build every key/value in a handful of array operations instead of one f-string per row.
+    digits = zero_padded_digits(rows, width)
+    key_array = with_prefix(b"k", digits)
+    value_array = with_prefix(b"value-", digits)
+    keys = key_array.tolist()
+    values = value_array.tolist()
+    arrow_keys = pa.array(key_array, type=pa.binary())
+    arrow_values = pa.array(value_array, type=pa.binary())
+    return keys, values, arrow_keys, arrow_values, key_array, value_array
 
 
 def run_once(name, rows, disable_wal, fn):
@@ -26,8 +66,9 @@ def run_once(name, rows, disable_wal, fn):
             elapsed = time.perf_counter() - start
 
             if rows:
-                last_key = f"k{rows - 1:0{max(8, len(str(rows)))}d}".encode()
-                expected = f"value-{rows - 1:0{max(8, len(str(rows)))}d}".encode()
+                width = key_width(rows)
+                last_key = make_key(rows - 1, width)
+                expected = make_value(rows - 1, width)
                 actual = db.get(last_key)
                 if actual != expected:
                     raise RuntimeError(f"verification failed for {name}: {actual!r} != {expected!r}")
@@ -37,37 +78,178 @@ def run_once(name, rows, disable_wal, fn):
     return elapsed
 
 
+def make_chunks(rows: int, batch_size: int):
+    # Committing bounded chunks keeps the batch memory small and lets RocksDB flush
+    # memtables while the next chunk is being built.
+    batch_size = batch_size if batch_size > 0 else max(rows, 1)
+    return [(start, min(start + batch_size, rows)) for start in range(0, rows, batch_size)]
+
+
+def python_write_batch(db, opts, data, chunks):
+    keys, values, *_ = data
+    # One batch object for all chunks: clear() keeps the WriteBatch's buffer
+    # capacity, so later chunks do not regrow it from scratch.
+    batch = pyrex.PyWriteBatch()
+    # Bind the bound methods once so the per-row loop does a local lookup instead
+    # of an attribute lookup on every put.
+    put, clear, write = batch.put, batch.clear, db.write
+    for start, stop in chunks:
+        for key, value in zip(keys[start:stop], values[start:stop]):
+            put(key, value)
+        write(batch, opts)
+        clear()
+
+
+def native_columnar_batch(db, opts, data, chunks):
+    _, _, arrow_keys, arrow_values, *_ = data
+    for start, stop in chunks:
+        db.write_columnar_batch(arrow_keys.slice(start, stop - start), arrow_values.slice(start, stop - start), write_options=opts)
+
+
+def write_batch_put_many(db, opts, data, chunks):
+    *_, key_array, value_array = data
+    batch = pyrex.PyWriteBatch()
+    for start, stop in chunks:
+        # NumPy fixed-width slices are views, so each chunk is handed over without copying.
+        batch.put_many(key_array[start:stop], value_array[start:stop])
+        db.write(batch, opts)
+        batch.clear()
+
+
+MODES = {
+    "python_write_batch": python_write_batch,
+    "write_batch_put_many_numpy": write_batch_put_many,
+    "native_columnar_batch_arrow_binary": native_columnar_batch,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def cached_data(rows: int):
+    # Worker processes build the dataset once and reuse it for every run they are handed.
+    return make_data(rows)
+
+
+def time_mode(name, rows, disable_wal, batch_size):
+    data = cached_data(rows)
+    chunks = make_chunks(rows, batch_size)
+    mode = MODES[name]
+    return name, run_once(name, rows, disable_wal, lambda db, opts: mode(db, opts, data, chunks))
+
+
+def warm_up(rows, disable_wal, batch_size, warmup, barrier=None):
+    """Untimed runs of every mode in the calling process, so that its page cache, allocator
+    and dataset are in a steady state before the first measurement it makes."""
+    for name in MODES:
+        for _ in range(warmup):
+            time_mode(name, rows, disable_wal, batch_size)
+    if barrier is not None:
+        # Workers start timing together, so no measured run overlaps another worker's warmup.
+        barrier.wait()
+
+
+RESULT_SCHEMA = pa.schema(
+    [
+        ("mode", pa.string()),
+        ("rows", pa.int64()),
+        ("disable_wal", pa.bool_()),
+        ("batch_size", pa.int64()),
+        ("elapsed_seconds", pa.float64()),
+        ("writes_per_second", pa.float64()),
+    ]
+)
+
+
+def write_result(writer, name, args, elapsed):
+    # One small row group per measurement: nothing accumulates in memory, and a
+    # sweep over many configurations can be read back with a single pq.read_table().
+    record = {
+        "mode": [name],
+        "rows": [args.rows],
+        "disable_wal": [args.disable_wal],
+        "batch_size": [args.batch_size if args.batch_size > 0 else args.rows],
+        "elapsed_seconds": [elapsed],
+        "writes_per_second": [args.rows / elapsed],
+    }
+    writer.write_table(pa.table(record, schema=RESULT_SCHEMA))
+
+
+def parse_cpus(spec: str) -> set:
+    """Parses a CPU list such as ``"0-3,6"`` into a set of CPU ids."""
+    cpus = set()
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
 def main():
     parser = argparse.ArgumentParser(description="Compare Python WriteBatch loop against native Arrow columnar ingestion.")
     parser.add_argument("--rows", type=int, default=100_000)
     parser.add_argument("--disable-wal", action="store_true")
     parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=0, help="Rows per committed batch (0 writes all rows in one batch).")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run independent (mode, repeat) measurements in this many processes. Every run uses its own "
+        "database directory, but concurrent runs share CPU, memory bandwidth and disk, so only use this "
+        "on machines with spare cores and IOPS.",
+    )
+    parser.add_argument("--results", type=Path, default=None, help="Stream every measurement to this Parquet file.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per mode before the measured repeats.")
+    parser.add_argument(
+        "--cpus",
+        type=parse_cpus,
+        default=None,
+        help="Pin the benchmark (and its worker processes) to these CPUs, e.g. '0-3'. Linux only; "
+        "combine with 'numactl --membind' to also keep memory on the local NUMA node.",
+    )
     args = parser.parse_args()
 
-    keys, values, arrow_keys, arrow_values = make_data(args.rows)
-
-    def python_write_batch(db, opts):
-        batch = pyrex.PyWriteBatch()
-        for key, value in zip(keys, values):
-            batch.put(key, value)
-        db.write(batch, opts)
-
-    def native_columnar_batch(db, opts):
-        db.write_columnar_batch(arrow_keys, arrow_values, write_options=opts)
-
-    modes = [
-        ("python_write_batch", python_write_batch),
-        ("native_columnar_batch_arrow_binary", native_columnar_batch),
-    ]
+    if args.cpus is not None:
+        # Set before any worker is started so every process inherits the same CPU set
+        # and caches are not shared with unrelated work scheduled on other cores.
+        os.sched_setaffinity(0, args.cpus)
 
     print(f"rows={args.rows}")
     print(f"disable_wal={args.disable_wal}")
     print(f"repeat={args.repeat}")
+    print(f"batch_size={args.batch_size if args.batch_size > 0 else args.rows}")
+    print(f"jobs={args.jobs}")
+    print(f"warmup={args.warmup}")
+    if args.cpus is not None:
+        print(f"cpus={','.join(map(str, sorted(args.cpus)))}")
+
+    tasks = [name for name in MODES for _ in range(args.repeat)]
+    task_args = (tasks, [args.rows] * len(tasks), [args.disable_wal] * len(tasks), [args.batch_size] * len(tasks))
+    # Warmup happens in every process that takes measurements, before its first one; each
+    # worker gets at least one task, so that all of them reach the barrier in warm_up().
+    jobs = min(args.jobs, len(tasks))
+    warmup_args = (args.rows, args.disable_wal, args.batch_size, args.warmup)
+    best_elapsed = {}
+    with contextlib.ExitStack() as stack:
+        run = map
+        if jobs > 1:
+            barrier = multiprocessing.Barrier(jobs) if args.warmup > 0 else None
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=warm_up, initargs=(*warmup_args, barrier)
+            )
+            run = stack.enter_context(executor).map
+        else:
+            warm_up(*warmup_args)
+        writer = None
+        if args.results:
+            writer = stack.enter_context(contextlib.closing(pq.ParquetWriter(args.results, RESULT_SCHEMA)))
+
+        for name, elapsed in run(time_mode, *task_args):
+            best_elapsed[name] = min(elapsed, best_elapsed.get(name, elapsed))
+            if writer is not None:
+                write_result(writer, name, args, elapsed)
 
     results = {}
-    for name, fn in modes:
-        timings = [run_once(name, args.rows, args.disable_wal, fn) for _ in range(args.repeat)]
-        best = min(timings)
+    for name in MODES:
+        best = best_elapsed[name]
         results[name] = best
         print(f"mode={name}")
         print(f"best_elapsed={best:.6f}")
@@ -12,12 +12,27 @@ options.max_open_files = 1000
 options.compression = pyrex.CompressionType.kLZ4Compression
 options.optimize_for_small_db() # Apply an optimization preset
 
+# I/O tuning for larger, write-heavy workloads.
+options.max_background_jobs = os.cpu_count() or 2
+# Direct I/O bypasses the OS page cache. It needs a filesystem with O_DIRECT support
+# (e.g. ext4 or xfs); on tmpfs, which /tmp often is, opening the database fails with
+# kernels before 6.6. Enable it for a db_path on such a filesystem:
+# options.use_direct_reads = True
+# options.use_direct_io_for_flush_and_compaction = True
+options.bytes_per_sync = 1 << 20 # Sync SST files incrementally, every 1MB
+options.optimize_filters_for_hits = True # Skip bloom filters on the last level
+# Full Bloom filters, left at RocksDB's default table format_version (from 5 on,
+# the filters probe one cache line per lookup);
+# keeping index/filter blocks in the block cache bounds their memory use.
+options.use_block_based_bloom_filter(10.0, cache_index_and_filter_blocks=True)
+
 db = pyrex.PyRocksDB(db_path, options)
 
 # Verify some configured options (values might be adjusted by RocksDB internally)
 retrieved_options = db.get_options()
 print(f"Configured max_open_files: {retrieved_options.max_open_files}") # Expected: 5000 (adjusted by optimize_for_small_db)
 print(f"Configured compression: {retrieved_options.compression}") # Expected: CompressionType.kLZ4Compression
+print(f"Configured use_direct_reads: {retrieved_options.use_direct_reads}") # Expected: False (see above)
 
 del db
 shutil.rmtree(db_path)
@@ -2,6 +2,8 @@ import pyrex
 import os
 import shutil
 
+import numpy as np
+
 db_path = "/tmp/pyrex_example_batch"
 if os.path.exists(db_path):
     shutil.rmtree(db_path)
@@ -25,5 +27,17 @@ print(f"Key1: {db.get(b'key1')}")       # Expected: None
 print(f"Key2: {db.get(b'key2').decode()}") # Expected: updated_value2
 print(f"Key3: {db.get(b'key3').decode()}") # Expected: value3
 
+# Add many puts in one call: the loop over rows runs in C++.
+# Keys and values can be lists of bytes, Arrow binary arrays, or NumPy bytes
+# ("S") arrays, whose fixed-width buffer is read directly.
+keys = np.char.add(b"bulk_key_", np.arange(5).astype("S1"))
+values = np.char.add(b"bulk_value_", np.arange(5).astype("S1"))
+
+bulk_batch = pyrex.PyWriteBatch()
+bulk_batch.put_many(keys, values)
+db.write(bulk_batch)
+
+print(f"bulk_key_3: {db.get(b'bulk_key_3').decode()}") # Expected: bulk_value_3
+
 del db
 shutil.rmtree(db_path)
@@ -1,7 +1,7 @@
 # setup.py
 import os
-import io
 import sys
+import shutil
 import subprocess
 import tarfile
 import urllib.request
@@ -10,7 +10,9 @@ from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext as _build_ext
 import platform
 import hashlib
+from functools import cached_property
 import pybind11
+from pybind11.setup_helpers import ParallelCompile
 
 # --- Project Configuration ---
 
@@ -67,6 +69,145 @@ def _detect_libc():
         return 'musl'
 
 
+def _env_flag(name, default=False):
+    """Reads a boolean build switch such as PYREX_USE_SYSTEM_ROCKSDB=1 from the environment."""
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _sha256_of(path):
+    """Returns the hex sha256 digest of a file without reading it into memory at once."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+, hashes in C from the file
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _is_clang():
+    """Whether the C++ compiler is clang (from CXX, or the macOS default toolchain)."""
+    cxx = os.environ.get('CXX', '')
+    return 'clang' in Path(cxx).name or (not cxx and sys.platform == 'darwin')
+
+
+def _lto_flag():
+    """Returns the LTO flag for the C++ compiler: ThinLTO for clang, full LTO for GCC."""
+    if _is_clang():
+        return '-flto=thin'
+    # -flto=auto runs the LTO partitions in parallel (GCC 10+).
+    return '-flto=auto' if _supports_cxx_flag('-flto=auto') else '-flto'
+
+
+def _supports_cxx_flag(flag):
+    """Checks that the C++ compiler used for RocksDB accepts ``flag`` by preprocessing an empty file."""
+    cxx = os.environ.get('CXX') or 'c++'
+    try:
+        result = subprocess.run([cxx, flag, '-E', '-x', 'c++', os.devnull],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _find_static_library(name, library_dirs):
+    """Returns the path of lib<name>.a in ``library_dirs`` or the compiler's default search path, or None."""
+    archive = f'lib{name}.a'
+    for lib_dir in library_dirs:
+        candidate = Path(lib_dir) / archive
+        if candidate.is_file():
+            return candidate
+    cxx = os.environ.get('CXX') or 'c++'
+    try:
+        found = subprocess.run([cxx, f'-print-file-name={archive}'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+    # The compiler echoes the bare name back when it does not find the file.
+    return Path(found) if os.path.isabs(found) and Path(found).is_file() else None
+
+
+def _native_cpu_flags():
+    """
+    Returns the flags that target the build machine's CPU. GCC on some non-x86 targets
+    only knows -mcpu=native, so each spelling is probed before it is used.
+    """
+    for arch_flag in ('-march=native', '-mcpu=native'):
+        if _supports_cxx_flag(arch_flag):
+            flags = [arch_flag]
+            if _supports_cxx_flag('-mtune=native'):
+                flags.append('-mtune=native')
+            return flags
+    return []
+
+
+def _pgo_flags():
+    """
+    Profile-guided optimization flags for the extension, driven by PYREX_PGO:
+    'generate' builds an instrumented module that writes profiles to PYREX_PGO_DIR
+    when exercised (e.g. by running the test suite), 'use' rebuilds it from them.
+    """
+    mode = os.environ.get('PYREX_PGO', '').strip().lower()
+    if not mode:
+        return []
+    if mode not in ('generate', 'use'):
+        raise RuntimeError("PYREX_PGO must be 'generate' or 'use'.")
+    if _PLATFORM == 'win32':
+        raise RuntimeError("PYREX_PGO is only supported with GCC and clang.")
+
+    profile_dir = Path(os.environ.get('PYREX_PGO_DIR', PROJECT_DIR / 'build' / 'pgo')).resolve()
+    if mode == 'generate':
+        return [f'-fprofile-generate={profile_dir}']
+
+    # clang expects the raw profiles merged first: llvm-profdata merge -o <dir>/default.profdata <dir>
+    if _is_clang():
+        return [f'-fprofile-use={profile_dir / "default.profdata"}']
+    # -fprofile-correction tolerates the inconsistent counters of multi-threaded runs.
+    return [f'-fprofile-use={profile_dir}', '-fprofile-correction']
+
+
+def _compiler_launcher():
+    """Returns 'ccache' or 'sccache' if one of them is on PATH, otherwise None."""
+    for launcher in ('ccache', 'sccache'):
+        if shutil.which(launcher):
+            return launcher
+    return None
+
+
+# Compression codecs RocksDB can be built with: name -> (library, built by default).
+# Each one is toggled with PYREX_WITH_<NAME>=0/1. ZLIB and BZ2 are opt-in for bundled
+# builds, so the wheel neither carries nor loads them unless asked to.
+_CODECS = {
+    'SNAPPY': ('snappy', True),
+    'LZ4': ('lz4', True),
+    'ZSTD': ('zstd', True),
+    'ZLIB': ('z', False),
+    'BZ2': ('bz2', False),
+}
+
+
+def _with_codec(name):
+    """
+    Whether a compression codec is compiled into (and linked with) RocksDB.
+    A system RocksDB is assumed to link every codec unless told otherwise.
+    """
+    _, default = _CODECS[name]
+    return _env_flag(f'PYREX_WITH_{name}', default=default or _env_flag('PYREX_USE_SYSTEM_ROCKSDB'))
+
+
+# Libraries the extension links against, per platform ('rocksdb' first for static linking).
+# The enabled codec libraries are inserted after 'rocksdb' on Linux/macOS, see _with_codec().
+_PLATFORM = 'win32' if sys.platform == 'win32' else ('darwin' if sys.platform == 'darwin' else 'linux')
+_PLATFORM_LIBS = {
+    'win32': ['rocksdb', 'shlwapi', 'rpcrt4', 'zlib'],
+    # uring may have perf. benefits. It is required when -DWITH_LIBURING=ON.
+    'linux': ['rocksdb', 'uring'],
+    'darwin': ['rocksdb'],
+}
+
+
 # --- Custom Build Logic ---
 class CMakeRocksDBExtension(Extension):
     """A placeholder to signal a CMake-based dependency."""
@@ -81,8 +222,19 @@ class build_ext(_build_ext):
     def run(self):
         self._ensure_cmake_is_available()
 
+        # Build several extensions concurrently if more are ever added (setuptools `-j`).
+        if self.parallel is None:
+            self.parallel = os.cpu_count() or 1
+
+        # Compile flags are not part of the up-to-date check, so a PGO build must not reuse
+        # a module compiled without (or with other) profile flags.
+        if _pgo_flags():
+            self.force = True
+
         # 1. Download and build RocksDB for the specified version.
-        if sys.platform != 'win32': # MacOS and Linux
+        if sys.platform != 'win32' and _env_flag('PYREX_USE_SYSTEM_ROCKSDB'):
+            rocksdb_install_path = self._find_system_rocksdb()
+        elif sys.platform != 'win32': # MacOS and Linux
             rocksdb_install_path = self._get_and_build_rocksdb()
         else:
             # using vspkg to manage the rocksdb dependency.
@@ -92,18 +244,16 @@ class build_ext(_build_ext):
                 raise RuntimeError("VCPKG_ROOT environment variable must be set on Windows.")
             rocksdb_install_path = Path(vcpkg_root) / 'installed' / 'x64-windows'
 
-        pyrex_ext = self._get_pyrex_extension()
+        pyrex_ext = self.pyrex_extension
         self._configure_pyrex_extension(pyrex_ext, rocksdb_install_path)
         self.extensions = [pyrex_ext] 
         # 3. Call the parent run() to build the pyrex extension.
         super().run()
 
-    def _get_pyrex_extension(self) -> Extension | None:
-        """Finds the 'pyrex._pyrex' extension object from the list."""
-        for ext in self.extensions:
-            if ext.name == 'pyrex._pyrex':
-                return ext
-        return None
+    @cached_property
+    def pyrex_extension(self) -> Extension | None:
+        """The 'pyrex._pyrex' extension object from the list (looked up once)."""
+        return next((ext for ext in self.extensions if ext.name == 'pyrex._pyrex'), None)
 
     def _ensure_cmake_is_available(self):
         """Check if CMake is installed and available."""
@@ -112,6 +262,27 @@ class build_ext(_build_ext):
         except OSError:
             raise RuntimeError("CMake must be installed to build this project.")
 
+    def _find_system_rocksdb(self):
+        """
+        Returns the install prefix of an already installed RocksDB, taken from
+        ROCKSDB_ROOT or, if that is not set, from pkg-config.
+        """
+        if os.environ.get('ROCKSDB_ROOT'):
+            prefix = Path(os.environ['ROCKSDB_ROOT'])
+        else:
+            try:
+                prefix = Path(subprocess.check_output(['pkg-config', '--variable=prefix', 'rocksdb']).decode().strip())
+            except (OSError, subprocess.CalledProcessError):
+                raise RuntimeError(
+                    "PYREX_USE_SYSTEM_ROCKSDB is set, but RocksDB was not found by pkg-config. "
+                    "Set ROCKSDB_ROOT to the RocksDB install prefix."
+                )
+
+        if not (prefix / "include" / "rocksdb" / "db.h").exists():
+            raise RuntimeError(f"No RocksDB headers found under {prefix / 'include'}.")
+        print(f"--- Using system RocksDB from {prefix} ---")
+        return prefix
+
     def _get_and_build_rocksdb(self):
         """
         Downloads, extracts, and builds a specific version of RocksDB.
@@ -125,21 +296,60 @@ class build_ext(_build_ext):
             """
             # C++ flags (rocksdb version 6.x and later)
             cxx_flags = "-std=c++20 -include cstdint -include system_error"
+            # One section per function/object, so that the extension's final link can
+            # garbage-collect the parts of librocksdb.a that it never references.
+            if _PLATFORM != 'win32':
+                cxx_flags += " -ffunction-sections -fdata-sections"
+
+            # Wheels must run on any CPU of their platform, so RocksDB is built PORTABLE
+            # by default. PYREX_NATIVE=1 targets the build machine instead, which lets
+            # RocksDB use hardware CRC32C/PCLMUL and vectorized hashing when available.
+            native = _env_flag('PYREX_NATIVE')
+            if native:
+                cpu_flags = _native_cpu_flags()
+                if not cpu_flags:
+                    print("--- PYREX_NATIVE is set, but the compiler accepts neither -march=native nor -mcpu=native ---")
+                cxx_flags = " ".join([cxx_flags, *cpu_flags])
+
+            cmake_args = []
+            # Ninja keeps every core busy until the final link, unlike recursive make.
+            # The generator is part of the args so that it also enters the cache key.
+            if shutil.which("ninja"):
+                cmake_args.append("-GNinja")
+
+            # A compiler cache lets cache-miss builds (e.g. a new config hash, or the same
+            # RocksDB for another Python version) reuse previously compiled objects.
+            launcher = _compiler_launcher()
+            if launcher:
+                cmake_args.extend([
+                    f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                    f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+                ])
 
-            cmake_args = [
+            cmake_args += [
                 "-DCMAKE_BUILD_TYPE=Release",
                 "-DCMAKE_POSITION_INDEPENDENT_CODE=ON",
                 f"-DCMAKE_CXX_FLAGS={cxx_flags}",
                 "-DROCKSDB_BUILD_SHARED=OFF",
                 "-DFAIL_ON_WARNINGS=OFF",
                 "-DWITH_TESTS=OFF",
+                "-DWITH_ALL_TESTS=OFF",
+                "-DWITH_JNI=OFF",
+                f"-DPORTABLE={0 if native else 1}",
 
-                "-DWITH_SNAPPY=ON",
-                "-DWITH_LZ4=ON",
-                "-DWITH_ZLIB=ON",
-                "-DWITH_BZ2=ON",
-                "-DWITH_ZSTD=ON",
             ]
+            cmake_args += [f"-DWITH_{name}={'ON' if _with_codec(name) else 'OFF'}" for name in _CODECS]
+
+            # Opt-in LTO: RocksDB objects carry LTO bitcode, and the extension is compiled and linked
+            # with a matching flag so that inlining can cross into RocksDB at the final link.
+            if _env_flag('PYREX_LTO'):
+                cmake_args.append("-DCMAKE_INTERPROCEDURAL_OPTIMIZATION=ON")
+
+            # FORCE_SSE42 compiles all of RocksDB with -msse4.2 -mpclmul, so the result no longer
+            # runs on older CPUs or on baseline VM models such as qemu64. Portable builds already
+            # pick hardware CRC32C at runtime, so it is only set for native builds or on request.
+            if platform.machine().lower() in ("x86_64", "amd64") and (native or _env_flag('PYREX_FORCE_SSE42')):
+                cmake_args.append("-DFORCE_SSE42=ON")
 
             # liburing-enabled builds are linux only
             if sys.platform.startswith("linux"):
@@ -155,14 +365,13 @@ class build_ext(_build_ext):
                 cmake_args.append(f"-DCMAKE_PREFIX_PATH={os.pathsep.join(cmake_prefixes)}")
 
             # Disable building RocksDB tools / benches that pull in gflags, etc.
-            major = int(rocksdb_version.split(".", 1)[0])
-            if major >= 7:
-                cmake_args.extend([
-                    "-DWITH_TOOLS=OFF",
-                    "-DWITH_CORE_TOOLS=OFF",
-                    "-DWITH_BENCHMARK_TOOLS=OFF",
-                    "-DWITH_GFLAGS=OFF",
-                ])
+            # The extension only links librocksdb, so these targets are never needed.
+            cmake_args.extend([
+                "-DWITH_TOOLS=OFF",
+                "-DWITH_CORE_TOOLS=OFF",
+                "-DWITH_BENCHMARK_TOOLS=OFF",
+                "-DWITH_GFLAGS=OFF",
+            ])
 
             return cmake_args
         
@@ -179,55 +388,44 @@ class build_ext(_build_ext):
         
         config_hash = hashlib.sha256(config_str.encode('utf-8')).hexdigest()[:16]
         
-        # Cache path management for linux:
-        if 'HOST_CACHE_DIR' in os.environ:
-            host_cache_root = Path('/host' + os.environ.get('HOST_CACHE_DIR'))
-            cache_root = host_cache_root if host_cache_root.parent.exists() else Path(os.environ.get('HOST_CACHE_DIR'))
-        else:
-            print("Did not find the cache root of the host!")
-            cache_root = Path('/host/tmp') if Path('/host').exists() else Path('/tmp')
-        
-        # Cache path management for MacOS:
-        if sys.platform == 'darwin': # MacOS (does not run in container)
-            cache_root = Path(os.environ.get('MACOS_HOST_CACHE_DIR',"/Users/runner/cibw-build-cache"))
-            
+        cache_root = self._get_cache_root()
 
-        build_dir = self.build_temp
-        
         # Create a version-specific installation directory for caching.
         install_dir = cache_root / f"rocksdb_install-{rocksdb_version}-{config_hash}"
 
-        # If the library for this version already exists, use the cache.
-        if (install_dir / "lib" / "librocksdb.a").exists() or \
-            (install_dir / "lib64" / "librocksdb.a").exists():
+        # The marker is written only after a successful install, so an interrupted
+        # install (which may already have copied librocksdb.a) is not taken for a hit.
+        config_marker = install_dir / ".pyrex_config_hash"
+        if config_marker.exists() and config_marker.read_text().strip() == config_hash:
             print(f"--- Using cached RocksDB v{rocksdb_version} from {install_dir} ---")
             return install_dir
         
         print(f"📦 --- No cache found. Starting new RocksDB v{rocksdb_version} build ---")
     
-        # Temporary directory for the source download and build
-        build_dir = Path(self.build_temp)
+        # Persistent directory for the source and build tree. Unlike build_temp it
+        # survives across invocations, so an interrupted or repeated build reuses
+        # CMakeCache.txt and the object files compiled so far.
+        keep_build_dir = bool(os.environ.get('PYREX_ROCKSDB_BUILD_DIR'))
+        if keep_build_dir:
+            build_dir = Path(os.environ['PYREX_ROCKSDB_BUILD_DIR']).expanduser()
+        else:
+            build_dir = cache_root / f"rocksdb_build-{rocksdb_version}-{config_hash}"
         build_dir.mkdir(parents=True, exist_ok=True)
         install_dir.mkdir(parents=True, exist_ok=True)
 
         ## Building rocksdb:
-        # 1. Download and Extract RocksDB Source
-        url = f"https://github.com/facebook/rocksdb/archive/refs/tags/v{rocksdb_version}.tar.gz"
-        print(f"--- Downloading RocksDB v{rocksdb_version} from {url} ---")
-        with urllib.request.urlopen(url) as response:
-            download_content = response.read()
-
-        # Assuming 'download_content' and 'build_dir' are defined
-        with io.BytesIO(download_content) as buffer:
-            with tarfile.open(fileobj=buffer, mode="r:gz") as tar:
-                top_level_dir = Path(tar.getmembers()[0].name).parts[0]
-                # Conditionally use the 'filter' argument based on Python version
-                if sys.version_info >= (3, 12):
-                    tar.extractall(path=build_dir, filter='data')
-                else:
-                    tar.extractall(path=build_dir)
-
-        source_dir = build_dir / top_level_dir
+        # 1. Download and Extract RocksDB Source (unless a configured tree already exists)
+        source_dir = self._find_configured_rocksdb_source(build_dir, rocksdb_version)
+        if source_dir is not None:
+            print(f"--- Reusing configured RocksDB build tree in {source_dir} ---")
+        elif (build_dir / f"rocksdb-{rocksdb_version}" / "CMakeLists.txt").exists():
+            # Extraction is atomic (see _extract_rocksdb_tarball), so a present
+            # CMakeLists.txt means the whole source tree is there.
+            source_dir = build_dir / f"rocksdb-{rocksdb_version}"
+            print(f"--- Reusing extracted RocksDB sources in {source_dir} ---")
+        else:
+            tarball_path = self._download_rocksdb_tarball(cache_root)
+            source_dir = self._extract_rocksdb_tarball(tarball_path, build_dir)
 
         # 2. Configure and Build with CMake
         cmake_build_dir = source_dir / "build"
@@ -237,57 +435,242 @@ class build_ext(_build_ext):
         cmake_args = [f'-DCMAKE_INSTALL_PREFIX={install_dir.resolve()}'] + cmake_args
 
         
+        # Keep the compiler cache next to the RocksDB cache unless the user configured one.
+        build_env = dict(os.environ)
+        launcher = _compiler_launcher()
+        if launcher:
+            cache_dir_var = 'SCCACHE_DIR' if launcher == 'sccache' else 'CCACHE_DIR'
+            build_env.setdefault(cache_dir_var, str(cache_root / launcher))
+            if launcher == 'ccache':
+                # Identify the compiler by its contents rather than its mtime, which changes
+                # whenever a fresh container/toolchain is installed with the same compiler.
+                build_env.setdefault('CCACHE_COMPILERCHECK', 'content')
+
         print(f"--- Configuring RocksDB v{rocksdb_version} ---")
-        subprocess.check_call(['cmake', '..'] + cmake_args, cwd=cmake_build_dir)
-        
-        
-        
-        
-        print(f"--- Building and installing RocksDB v{rocksdb_version} ---")
-        subprocess.check_call(['cmake', '--build', '.', '--target', 'install'], cwd=cmake_build_dir)
-            
+        subprocess.check_call(['cmake', '..'] + cmake_args, cwd=cmake_build_dir, env=build_env)
+
+        # Build in parallel; CMAKE_BUILD_PARALLEL_LEVEL (if set) takes precedence
+        # so that CI runners can limit the number of compiler processes.
+        build_jobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL") or str(os.cpu_count() or 4)
+
+        print(f"--- Building and installing RocksDB v{rocksdb_version} ({build_jobs} jobs) ---")
+        # Exporting the level as well covers nested builds (e.g. third-party dependencies
+        # built through ExternalProject) that do not see the --parallel flag.
+        subprocess.check_call(
+            ['cmake', '--build', '.', '--target', 'install', '--parallel', build_jobs, '--config', 'Release'],
+            cwd=cmake_build_dir,
+            env={**build_env, 'CMAKE_BUILD_PARALLEL_LEVEL': build_jobs},
+        )
+
+        config_marker.write_text(config_hash + "\n")
+
+        # Once installed, the hashed build tree is only needed again if the install
+        # directory disappears; drop it so that it does not bloat CI caches of cache_root.
+        # An explicit PYREX_ROCKSDB_BUILD_DIR is kept for incremental rebuilds.
+        if not keep_build_dir:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
         return install_dir
 
+    def _find_configured_rocksdb_source(self, build_dir, rocksdb_version):
+        """
+        Returns the rocksdb-<version> source directory in build_dir if its 'build'
+        subdirectory already holds a CMake cache configured for that source, or None.
+        Trees of other RocksDB versions (e.g. from before a version bump) are ignored.
+        """
+        source_dir = build_dir / f"rocksdb-{rocksdb_version}"
+        cmake_cache = source_dir / "build" / "CMakeCache.txt"
+        if not cmake_cache.is_file():
+            return None
+        with open(cmake_cache, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("CMAKE_HOME_DIRECTORY:INTERNAL="):
+                    configured_source = Path(line.split("=", 1)[1].strip())
+                    return source_dir if configured_source.resolve() == source_dir.resolve() else None
+        return None
+
+    def _get_cache_root(self):
+        """
+        Returns the directory that holds the RocksDB source tarball and the
+        hashed install directories, so they survive across wheel builds.
+        """
+        # Explicit override, e.g. for developer machines or custom CI layouts.
+        if os.environ.get('PYREX_ROCKSDB_CACHE'):
+            return Path(os.environ['PYREX_ROCKSDB_CACHE']).expanduser()
+
+        # Cache path management for MacOS (does not run in container):
+        if sys.platform == 'darwin' and os.environ.get('MACOS_HOST_CACHE_DIR'):
+            return Path(os.environ['MACOS_HOST_CACHE_DIR'])
+
+        # Cache path management for linux (cibuildwheel mounts the host at /host):
+        if 'HOST_CACHE_DIR' in os.environ:
+            host_cache_root = Path('/host' + os.environ.get('HOST_CACHE_DIR'))
+            return host_cache_root if host_cache_root.parent.exists() else Path(os.environ.get('HOST_CACHE_DIR'))
+        if Path('/host').exists():
+            return Path('/host/tmp')
+
+        print("Did not find the cache root of the host!")
+        xdg_cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(xdg_cache_home) / 'pyrex-rocksdb'
+
+    def _download_rocksdb_tarball(self, cache_root):
+        """
+        Returns the path of the RocksDB source tarball, downloading it into the
+        cache root only if it is not already there.
+        """
+        tarball_path = cache_root / f"rocksdb-{rocksdb_version}.tar.gz"
+        # Optional pinned digest; without it the archive is used unverified.
+        expected_sha256 = os.environ.get('PYREX_ROCKSDB_SHA256', '').strip().lower()
+
+        if tarball_path.exists():
+            if not expected_sha256 or _sha256_of(tarball_path) == expected_sha256:
+                print(f"--- Using cached RocksDB v{rocksdb_version} source tarball {tarball_path} ---")
+                return tarball_path
+            print(f"--- Cached tarball {tarball_path} does not match PYREX_ROCKSDB_SHA256, downloading again ---")
+            tarball_path.unlink()
+
+        url = f"https://github.com/facebook/rocksdb/archive/refs/tags/v{rocksdb_version}.tar.gz"
+        print(f"--- Downloading RocksDB v{rocksdb_version} from {url} ---")
+        tarball_path.parent.mkdir(parents=True, exist_ok=True)
+        # Stream to disk instead of holding the whole archive in memory, and only
+        # expose the file under its final name once the download is complete.
+        partial_path = tarball_path.with_name(tarball_path.name + ".part")
+        with urllib.request.urlopen(url) as response, open(partial_path, "wb") as out:
+            shutil.copyfileobj(response, out, 1 << 20)
+
+        if expected_sha256:
+            actual_sha256 = _sha256_of(partial_path)
+            if actual_sha256 != expected_sha256:
+                partial_path.unlink()
+                raise RuntimeError(
+                    f"sha256 mismatch for {url}: expected {expected_sha256}, got {actual_sha256}."
+                )
+
+        os.replace(partial_path, tarball_path)
+        return tarball_path
+
+    def _extract_rocksdb_tarball(self, tarball_path, build_dir):
+        """Extracts the RocksDB sources into build_dir and returns the source directory."""
+        top_level_dirs = []
+
+        def _members(tar):
+            # The top-level directory is taken from the first entry as it streams past,
+            # since the streaming ("r|gz") mode cannot look ahead with getmembers().
+            for member in tar:
+                if not top_level_dirs:
+                    top_level_dirs.append(Path(member.name).parts[0])
+                yield member
+
+        # Extract into a staging directory and move the tree into place at the end, so
+        # an interrupted extraction never leaves a partial source tree behind.
+        staging_dir = build_dir / ".extracting"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        def _extract(tar):
+            # Conditionally use the 'filter' argument based on Python version
+            if sys.version_info >= (3, 12):
+                tar.extractall(path=staging_dir, members=_members(tar), filter='data')
+            else:
+                tar.extractall(path=staging_dir, members=_members(tar))
+
+        pigz = shutil.which('pigz')
+        if pigz:
+            # pigz decompresses on separate threads while tarfile unpacks the plain
+            # tar stream, instead of inflating single-threaded inside this process.
+            with subprocess.Popen([pigz, '-dc', str(tarball_path)], stdout=subprocess.PIPE) as proc:
+                with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                    _extract(tar)
+            if proc.returncode != 0:
+                raise RuntimeError(f"pigz failed to decompress {tarball_path} (exit code {proc.returncode}).")
+        else:
+            # Streaming mode decompresses the archive once; getmembers() on a seekable
+            # archive would first scan all of it and then decompress it again to extract.
+            with tarfile.open(tarball_path, mode="r|gz") as tar:
+                _extract(tar)
+
+        source_dir = build_dir / top_level_dirs[0]
+        shutil.rmtree(source_dir, ignore_errors=True)
+        os.replace(staging_dir / top_level_dirs[0], source_dir)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return source_dir
+
     def _configure_pyrex_extension(self, ext, rocksdb_install_path):
         """Updates the pyrex extension with the correct paths and libraries."""
-        ext.include_dirs.append(str(rocksdb_install_path / "include"))
+        def _append_unique(dirs, path):
+            # Every duplicate -I/-L entry is searched again for each header/library lookup.
+            if str(path) not in dirs:
+                dirs.append(str(path))
+
+        _append_unique(ext.include_dirs, rocksdb_install_path / "include")
 
-        lib_dir = rocksdb_install_path / ("lib64" if (rocksdb_install_path / "lib64").exists() else "lib")
-        ext.library_dirs.append(str(lib_dir))
+        lib_dir = next(
+            (p for p in (rocksdb_install_path / "lib64", rocksdb_install_path / "lib") if p.is_dir()),
+            rocksdb_install_path / "lib",
+        )
+        _append_unique(ext.library_dirs, lib_dir)
 
         dependency_prefixes = [p for p in os.environ.get("CMAKE_PREFIX_PATH", "").split(os.pathsep) if p]
         if os.environ.get("BREW_PREFIX"):
             dependency_prefixes.append(os.environ["BREW_PREFIX"])
 
         for prefix in dependency_prefixes:
-            if not prefix:
-                continue
             prefix_path = Path(prefix)
             include_dir = prefix_path / "include"
             lib_dir = prefix_path / "lib"
             if include_dir.exists():
-                ext.include_dirs.append(str(include_dir))
+                _append_unique(ext.include_dirs, include_dir)
             if lib_dir.exists():
-                ext.library_dirs.append(str(lib_dir))
-
-
-        # libs_only_win = ['shlwapi','rpcrt4','zlibstatic']
-        libs_only_win = ['shlwapi','rpcrt4','zlib']
-        libs_only_linux_macos = ['z', 'snappy','lz4','bz2','zstd']
-        if sys.platform.startswith('linux'):
-            # may have perf. benefits. It is required
-            # when -DWITH_LIBURING=ON. 
-            libs_only_linux_macos += ['uring']
-            
-        libs_both = ['rocksdb']
-        
-        # libs_both = ['rocksdb','lz4','bz2','zstd']
-        if sys.platform == "win32":
-            _win_ext_libs = libs_both + libs_only_win
-            ext.libraries.extend(libs_both + libs_only_win)
-        else:
-            ext.libraries.extend(libs_both + libs_only_linux_macos)
-        
+                _append_unique(ext.library_dirs, lib_dir)
+
+        libraries = list(_PLATFORM_LIBS[_PLATFORM])
+        if _PLATFORM != 'win32':
+            # Only link the codecs RocksDB was built with; the others are never referenced.
+            libraries[1:1] = [lib for name, (lib, _) in _CODECS.items() if _with_codec(name)]
+
+        # PYREX_STATIC_COMPRESSION=1 links the codec archives into the extension instead of the
+        # shared libraries, so the wheel needs no system codecs at runtime and the codec calls are
+        # direct. The archives must be built with -fPIC; codecs without one stay dynamically linked.
+        # `-l:lib<name>.a` keeps each archive at its place after 'rocksdb' on the link line (GNU ld).
+        if _PLATFORM == 'linux' and _env_flag('PYREX_STATIC_COMPRESSION'):
+            codec_libs = {lib for lib, _ in _CODECS.values()}
+            for i, lib in enumerate(libraries):
+                archive = _find_static_library(lib, ext.library_dirs) if lib in codec_libs else None
+                if archive:
+                    _append_unique(ext.library_dirs, archive.parent)
+                    libraries[i] = f':{archive.name}'
+                elif lib in codec_libs:
+                    print(f"--- PYREX_STATIC_COMPRESSION: no lib{lib}.a found, linking {lib} dynamically ---")
+
+        ext.libraries.extend(lib for lib in libraries if lib not in ext.libraries)
+
+        # Only PyInit__pyrex needs to be exported (PYBIND11_MODULE marks it visible); hiding
+        # everything else keeps the dynamic symbol table, and the work ld.so does on import, small.
+        if _PLATFORM != 'win32':
+            ext.extra_compile_args.extend(['-fvisibility=hidden', '-fvisibility-inlines-hidden'])
+
+        # Drop the unreferenced RocksDB sections (see -ffunction-sections in the RocksDB
+        # build) from the extension; this shrinks the module and its cold-start footprint.
+        if _PLATFORM == 'linux':
+            ext.extra_compile_args.extend(['-ffunction-sections', '-fdata-sections'])
+            # Symbols of the statically linked RocksDB and codec archives stay local as well.
+            ext.extra_link_args.extend(['-Wl,--gc-sections', '-Wl,--exclude-libs,ALL'])
+        elif _PLATFORM == 'darwin':
+            ext.extra_link_args.append('-Wl,-dead_strip')
+
+        pgo_flags = _pgo_flags()
+        ext.extra_compile_args.extend(pgo_flags)
+        ext.extra_link_args.extend(pgo_flags)
+
+        if _env_flag('PYREX_LTO'):
+            if _PLATFORM == 'win32':
+                # MSVC whole-program optimization of the extension's own objects.
+                ext.extra_compile_args.append('/GL')
+                ext.extra_link_args.append('/LTCG')
+            else:
+                lto_flag = _lto_flag()
+                ext.extra_compile_args.append(lto_flag)
+                ext.extra_link_args.append(lto_flag)
+
         print(f"--- Configured pyrex extension with RocksDB paths ---")
 
 # --- Extension Definitions ---
@@ -302,17 +685,28 @@ pyrex_module = Extension(
         'src/pyrex/db.cpp',
         'src/pyrex/iterator.cpp',
         'src/pyrex/options.cpp',
+        'src/pyrex/utils.cpp',
         'src/pyrex/write_batch.cpp',
     ],
+    # Header edits rebuild the extension too, not only edits of the sources above.
+    depends=sorted(str(path.relative_to(PROJECT_DIR)) for path in (PROJECT_DIR / 'src' / 'pyrex').glob('*.hpp')),
     language='c++',
     include_dirs=[], 
     library_dirs=[],
     libraries=[],
-    extra_compile_args=['-std=c++20'] if sys.platform != 'win32' else ['/std:c++20'],
+    # -O3 explicitly: the interpreter's CFLAGS may only ask for -O2, and the bindings are
+    # on the hot path of every get/put/iterator call.
+    extra_compile_args=['-std=c++20', '-O3'] if sys.platform != 'win32' else ['/std:c++20'],
 )
 
 pyrex_module.include_dirs.append(pybind11.get_include())
 
+# setuptools compiles the sources of one extension sequentially; compile the pyrex
+# translation units in parallel instead (CMAKE_BUILD_PARALLEL_LEVEL caps the jobs,
+# like for the RocksDB build). When the extension is out of date (see `depends`),
+# every object is recompiled: a per-object source mtime check misses header edits.
+ParallelCompile("CMAKE_BUILD_PARALLEL_LEVEL").install()
+
 # --- Main Setup Call ---
 
 setup(
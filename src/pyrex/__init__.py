@@ -1,17 +1,25 @@
 # This makes functions and classes like `PyRocksDB` directly available as `pyrex.PyRocksDB`
 from ._pyrex import *
 
-# Version information (highly recommended)
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:  # Python < 3.8
-    from importlib_metadata import version, PackageNotFoundError # pip install importlib_metadata for older Pythons
 
-try:
-    __version__ = version("pyrex-rocksdb") # Use the 'name' from pyproject.toml
-except PackageNotFoundError:
-    # Package is not installed (e.g., running tests in dev mode without editable install)
-    __version__ = "unknown"
+def __getattr__(name):
+    # Version information, resolved on first access only: importlib.metadata scans the
+    # sys.path entries for the distribution, which `import pyrex` would otherwise pay for.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        from importlib_metadata import version, PackageNotFoundError # pip install importlib_metadata for older Pythons
+
+    global __version__
+    try:
+        __version__ = version("pyrex-rocksdb") # Use the 'name' from pyproject.toml
+    except PackageNotFoundError:
+        # Package is not installed (e.g., running tests in dev mode without editable install)
+        __version__ = "unknown"
+    return __version__
 
 
 # Package Docstring 
@@ -10,6 +10,7 @@
 #include "exceptions.hpp"
 #include "iterator.hpp"
 #include "options.hpp"
+#include "utils.hpp"
 #include "write_batch.hpp"
 
 #include "rocksdb/options.h"
@@ -49,7 +50,7 @@ void bind_pyrex(py::module_& m) {
     )doc")
         .value("kNoCompression", rocksdb::kNoCompression, "No compression.")
         .value("kSnappyCompression", rocksdb::kSnappyCompression, "Snappy compression (default).")
-        .value("kBZip2Compression", rocksdb::kBZip2Compression, "BZip2 compression.")
+        .value("kBZip2Compression", rocksdb::kBZip2Compression, "BZip2 compression (only available in builds with PYREX_WITH_BZ2=1).")
         .value("kLZ4Compression", rocksdb::kLZ4Compression, "LZ4 compression.")
         .value("kLZ4HCCompression", rocksdb::kLZ4HCCompression, "LZ4HC (high compression) compression.")
         .value("kXpressCompression", rocksdb::kXpressCompression, "Xpress compression.")
@@ -58,14 +59,26 @@ void bind_pyrex(py::module_& m) {
     py::class_<PyReadOptions, std::shared_ptr<PyReadOptions>>(m, "ReadOptions", R"doc(
         Configuration options for read operations (Get, Iterator).
     )doc")
-        .def(py::init<>(), "Constructs a new ReadOptions object with default settings.")
+        .def(py::init([](bool fill_cache, bool verify_checksums) {
+            auto opts = std::make_shared<PyReadOptions>();
+            opts->set_fill_cache(fill_cache);
+            opts->set_verify_checksums(verify_checksums);
+            return opts;
+        }), py::kw_only(), py::arg("fill_cache") = true, py::arg("verify_checksums") = true,
+            "Constructs a new ReadOptions object; settings not given keep their defaults.")
         .def_property("fill_cache", &PyReadOptions::get_fill_cache, &PyReadOptions::set_fill_cache, "If True, reads will fill the block cache. Defaults to True.")
         .def_property("verify_checksums", &PyReadOptions::get_verify_checksums, &PyReadOptions::set_verify_checksums, "If True, all data read from underlying storage will be verified against its checksums. Defaults to True.");
 
     py::class_<PyWriteOptions, std::shared_ptr<PyWriteOptions>>(m, "WriteOptions", R"doc(
         Configuration options for write operations (Put, Delete, Write).
     )doc")
-        .def(py::init<>(), "Constructs a new WriteOptions object with default settings.")
+        .def(py::init([](bool sync, bool disable_wal) {
+            auto opts = std::make_shared<PyWriteOptions>();
+            opts->set_sync(sync);
+            opts->set_disable_wal(disable_wal);
+            return opts;
+        }), py::kw_only(), py::arg("sync") = false, py::arg("disable_wal") = false,
+            "Constructs a new WriteOptions object; settings not given keep their defaults.")
         .def_property("sync", &PyWriteOptions::get_sync, &PyWriteOptions::set_sync, "If True, the write will be flushed from the OS buffer cache before the write is considered complete. Defaults to False.")
         .def_property("disable_wal", &PyWriteOptions::get_disable_wal, &PyWriteOptions::set_disable_wal, "If True, writes will not be written to the Write Ahead Log. Defaults to False.");
 
@@ -76,12 +89,19 @@ void bind_pyrex(py::module_& m) {
         to provide a convenient way to configure database behavior from Python.
     )doc")
         .def(py::init<>(), "Constructs a new PyOptions object with default settings.")
+        .def("__copy__", [](const PyOptions& self) { return PyOptions(self); }, "Returns an independent copy of these options.")
+        .def("__deepcopy__", [](const PyOptions& self, py::dict /* memo */) { return PyOptions(self); }, py::arg("memo"), "Returns an independent copy of these options.")
         .def_property("create_if_missing", &PyOptions::get_create_if_missing, &PyOptions::set_create_if_missing, "If True, the database will be created if it is missing. Defaults to True.")
         .def_property("error_if_exists", &PyOptions::get_error_if_exists, &PyOptions::set_error_if_exists, "If True, an error is raised if the database already exists. Defaults to False.")
         .def_property("max_open_files", &PyOptions::get_max_open_files, &PyOptions::set_max_open_files, "Number of open files that can be used by the DB. Defaults to -1 (unlimited).")
         .def_property("write_buffer_size", &PyOptions::get_write_buffer_size, &PyOptions::set_write_buffer_size, "Amount of data to build up in a memory buffer (MemTable) before flushing. Defaults to 64MB.")
+        .def_property("max_write_buffer_number", &PyOptions::get_max_write_buffer_number, &PyOptions::set_max_write_buffer_number, "Maximum number of MemTables (active plus those waiting to be flushed) held in memory. Defaults to 2.")
         .def_property("compression", &PyOptions::get_compression, &PyOptions::set_compression, "The compression type to use for sst files. Defaults to Snappy.")
         .def_property("max_background_jobs", &PyOptions::get_max_background_jobs, &PyOptions::set_max_background_jobs, "Maximum number of concurrent background jobs (compactions and flushes).")
+        .def_property("use_direct_reads", &PyOptions::get_use_direct_reads, &PyOptions::set_use_direct_reads, "If True, user and compaction reads bypass the OS page cache (O_DIRECT). Requires a filesystem that supports direct I/O. Defaults to False.")
+        .def_property("use_direct_io_for_flush_and_compaction", &PyOptions::get_use_direct_io_for_flush_and_compaction, &PyOptions::set_use_direct_io_for_flush_and_compaction, "If True, flush and compaction writes bypass the OS page cache (O_DIRECT). Requires a filesystem that supports direct I/O. Defaults to False.")
+        .def_property("bytes_per_sync", &PyOptions::get_bytes_per_sync, &PyOptions::set_bytes_per_sync, "Incrementally sync SST files to disk every this many bytes while they are written. Defaults to 0 (disabled).")
+        .def_property("optimize_filters_for_hits", &PyOptions::get_optimize_filters_for_hits, &PyOptions::set_optimize_filters_for_hits, "If True, no filters are built for the last LSM level, saving filter memory when most lookups find their key. Defaults to False.")
         .def("increase_parallelism", &PyOptions::increase_parallelism, py::arg("total_threads"), R"doc(
             Increases RocksDB's parallelism by tuning background threads.
 
@@ -91,14 +111,24 @@ void bind_pyrex(py::module_& m) {
         .def("optimize_for_small_db", &PyOptions::optimize_for_small_db, R"doc(
             Optimizes RocksDB for small databases by reducing memory and CPU consumption.
         )doc", py::call_guard<py::gil_scoped_release>())
-        .def("use_block_based_bloom_filter", &PyOptions::use_block_based_bloom_filter, py::arg("bits_per_key") = 10.0, R"doc(
+        .def("use_block_based_bloom_filter", &PyOptions::use_block_based_bloom_filter,
+            py::arg("bits_per_key") = 10.0,
+            py::arg("format_version") = py::none(),
+            py::arg("cache_index_and_filter_blocks") = false, R"doc(
             Enables a Bloom filter for block-based tables to speed up 'Get' operations.
 
             Args:
                 bits_per_key (float): The number of bits per key for the Bloom filter.
                     Higher values reduce false positives but increase memory usage.
+                format_version (int, optional): The block-based table format version.
+                    Defaults to the RocksDB default. Versions from 5 on use the
+                    cache-local Bloom filter that probes a single cache line per key.
+                cache_index_and_filter_blocks (bool): If True, index and filter blocks
+                    are stored in (and evicted from) the block cache instead of being
+                    held in memory for every open table file. Defaults to False.
         )doc", py::call_guard<py::gil_scoped_release>())
         .def_property("cf_write_buffer_size", &PyOptions::get_cf_write_buffer_size, &PyOptions::set_cf_write_buffer_size, "Default write_buffer_size for newly created Column Families.")
+        .def_property("cf_max_write_buffer_number", &PyOptions::get_cf_max_write_buffer_number, &PyOptions::set_cf_max_write_buffer_number, "Default max_write_buffer_number for newly created Column Families.")
         .def_property("cf_compression", &PyOptions::get_cf_compression, &PyOptions::set_cf_compression, "Default compression type for newly created Column Families.");
 
     py::class_<PyColumnFamilyHandle, std::shared_ptr<PyColumnFamilyHandle>>(m, "ColumnFamilyHandle", R"doc(
@@ -116,11 +146,21 @@ void bind_pyrex(py::module_& m) {
         .def(py::init<>(), "Constructs an empty write batch.")
         .def("put", &PyWriteBatch::put, py::arg("key"), py::arg("value"), "Adds a key-value pair to the batch for the default column family.")
         .def("put_cf", &PyWriteBatch::put_cf, py::arg("cf_handle"), py::arg("key"), py::arg("value"), "Adds a key-value pair to the batch for a specific column family.")
+        .def("put_many", &PyWriteBatch::put_many, py::arg("keys"), py::arg("values"), "Adds many key-value pairs to the batch for the default column family in one call. Accepts Arrow binary/string arrays, NumPy bytes (S) arrays, or sequences of bytes.")
+        .def("put_many", &PyWriteBatch::put_many_pairs, py::arg("pairs"), "Adds a list or tuple of (key, value) bytes pairs to the batch for the default column family in one call.")
+        .def("put_many_cf", &PyWriteBatch::put_many_cf, py::arg("cf_handle"), py::arg("keys"), py::arg("values"), "Adds many key-value pairs to the batch for a specific column family in one call. Accepts the same inputs as put_many.")
+        .def("put_many_cf", &PyWriteBatch::put_many_pairs_cf, py::arg("cf_handle"), py::arg("pairs"), "Adds a list or tuple of (key, value) bytes pairs to the batch for a specific column family in one call.")
         .def("delete", &PyWriteBatch::del, py::arg("key"), "Adds a key deletion to the batch for the default column family.")
         .def("delete_cf", &PyWriteBatch::del_cf, py::arg("cf_handle"), py::arg("key"), "Adds a key deletion to the batch for a specific column family.")
+        .def("delete_many", &PyWriteBatch::delete_many, py::arg("keys"), "Adds many key deletions to the batch for the default column family in one call. Accepts the same key inputs as put_many.")
+        .def("delete_many_cf", &PyWriteBatch::delete_many_cf, py::arg("cf_handle"), py::arg("keys"), "Adds many key deletions to the batch for a specific column family in one call.")
         .def("merge", &PyWriteBatch::merge, py::arg("key"), py::arg("value"), "Adds a merge operation to the batch for the default column family.")
         .def("merge_cf", &PyWriteBatch::merge_cf, py::arg("cf_handle"), py::arg("key"), py::arg("value"), "Adds a merge operation to the batch for a specific column family.")
-        .def("clear", &PyWriteBatch::clear, "Clears all operations from the batch.");
+        .def("clear", &PyWriteBatch::clear, "Clears all operations from the batch.")
+        .def("__enter__", [](PyWriteBatch &batch) -> PyWriteBatch& { return batch; })
+        .def("__exit__", [](PyWriteBatch &batch, py::object /* type */, py::object /* value */, py::object /* traceback */) {
+            batch.clear();
+        });
 
     py::class_<PyRocksDBIterator, std::shared_ptr<PyRocksDBIterator>>(m, "PyRocksDBIterator", R"doc(
         An iterator for traversing key-value pairs in a RocksDB database.
@@ -133,6 +173,9 @@ void bind_pyrex(py::module_& m) {
         .def("prev", &PyRocksDBIterator::prev, "Moves the iterator to the previous entry.", py::call_guard<py::gil_scoped_release>())
         .def("key", &PyRocksDBIterator::key, "Returns the current key as bytes, or None if invalid.")
         .def("value", &PyRocksDBIterator::value, "Returns the current value as bytes, or None if invalid.")
+        .def("key_equals", &PyRocksDBIterator::key_equals, py::arg("expected"), "Returns True if the iterator is valid and its current key equals `expected`, without copying the key.")
+        .def("value_equals", &PyRocksDBIterator::value_equals, py::arg("expected"), "Returns True if the iterator is valid and its current value equals `expected`, without copying the value.")
+        .def("collect_keys", &PyRocksDBIterator::collect_keys, py::arg("limit") = py::none(), "Returns the keys from the current position onwards (at most `limit` of them) as a list of bytes, advancing the iterator past them.")
         .def("check_status", &PyRocksDBIterator::check_status, "Raises RocksDBException if an error occurred during iteration.", py::call_guard<py::gil_scoped_release>());
 
     py::class_<PyRocksDB, std::shared_ptr<PyRocksDB>>(m, "PyRocksDB", R"doc(
@@ -156,10 +199,15 @@ void bind_pyrex(py::module_& m) {
         )doc", py::call_guard<py::gil_scoped_release>())
         .def("put", &PyRocksDB::put, py::arg("key"), py::arg("value"), py::arg("write_options") = nullptr, "Inserts a key-value pair.", py::call_guard<py::gil_scoped_release>())
         .def("get", &PyRocksDB::get, py::arg("key"), py::arg("read_options") = nullptr, "Retrieves the value for a key.")
+        .def("get_equals", &PyRocksDB::get_equals, py::arg("key"), py::arg("expected"), py::arg("read_options") = nullptr, "Returns True if the key exists and its value equals `expected`, without copying the value into Python.", py::call_guard<py::gil_scoped_release>())
+        .def("put_and_verify", &PyRocksDB::put_and_verify, py::arg("key"), py::arg("value"), py::arg("write_options") = nullptr, py::arg("read_options") = nullptr, "Inserts a key-value pair and reads it back in the same call. Returns True if the read returns `value`.", py::call_guard<py::gil_scoped_release>())
+        .def("multi_get", &PyRocksDB::multi_get, py::arg("keys"), py::arg("read_options") = nullptr, "Retrieves the values for a list of keys in one batched lookup. Missing keys map to None.")
         .def("delete", &PyRocksDB::del, py::arg("key"), py::arg("write_options") = nullptr, "Deletes a key.", py::call_guard<py::gil_scoped_release>())
         .def("write", &PyRocksDB::write, py::arg("write_batch"), py::arg("write_options") = nullptr, "Applies a batch of operations atomically.", py::call_guard<py::gil_scoped_release>())
         .def("write_columnar_batch", &PyRocksDB::write_columnar_batch, py::arg("keys"), py::arg("values"), py::kw_only(), py::arg("write_options") = nullptr, py::arg("on_null") = "error", "Writes columnar key/value arrays using a native RocksDB WriteBatch.")
-        .def("new_iterator", &PyRocksDB::new_iterator, py::arg("read_options") = nullptr, "Creates a new iterator.", py::keep_alive<0, 1>())
+        .def("new_iterator", &PyRocksDB::new_iterator, py::arg("read_options") = nullptr, "Creates a new iterator.", py::keep_alive<0, 1>(), py::call_guard<py::gil_scoped_release>())
+        .def("scan_keys", &PyRocksDB::scan_keys, py::arg("lower") = py::none(), py::arg("upper") = py::none(), py::arg("read_options") = nullptr, "Returns the keys in [lower, upper) as a list of bytes, in one call. Either bound may be omitted.")
+        .def("scan_items", &PyRocksDB::scan_items, py::arg("lower") = py::none(), py::arg("upper") = py::none(), py::arg("read_options") = nullptr, "Returns the entries in [lower, upper) as a list of (key, value) bytes tuples, in one call. Either bound may be omitted.")
         .def("get_options", &PyRocksDB::get_options, "Returns the options the database was opened with.")
         .def_property("default_read_options", &PyRocksDB::get_default_read_options, &PyRocksDB::set_default_read_options, "The default ReadOptions used for get and iterator operations.")
         .def_property("default_write_options", &PyRocksDB::get_default_write_options, &PyRocksDB::set_default_write_options, "The default WriteOptions used for put, delete, and write operations.")
@@ -169,6 +217,20 @@ void bind_pyrex(py::module_& m) {
             db.close();
         });
 
+    m.def("destroy_db", &destroy_db, py::arg("path"), py::arg("options") = nullptr, R"doc(
+        Deletes the database at `path`, including all of its column families, and its directory.
+
+        The database must not be open. Files in the directory that RocksDB did not create are
+        left in place (and then so is the directory).
+    )doc", py::call_guard<py::gil_scoped_release>());
+
+    m.def("make_keys", &make_keys, py::arg("prefix"), py::arg("n"), py::arg("start") = 0, py::arg("width") = 0, R"doc(
+        Returns the keys `prefix + b"<i>"` for i in range(start, start + n), as a list of bytes.
+
+        The number is zero-padded to at least `width` digits, so that keys of one width sort
+        numerically. Each key is built once at its final size, in C++.
+    )doc");
+
     py::class_<PyRocksDBExtended, PyRocksDB, std::shared_ptr<PyRocksDBExtended>>(m, "PyRocksDBExtended", R"doc(
         An advanced Python wrapper for RocksDB with full Column Family support.
     )doc")
@@ -187,11 +249,16 @@ void bind_pyrex(py::module_& m) {
         )doc", py::call_guard<py::gil_scoped_release>())
         .def("put_cf", &PyRocksDBExtended::put_cf, py::arg("cf_handle"), py::arg("key"), py::arg("value"), py::arg("write_options") = nullptr, "Inserts a key-value pair into a specific column family.", py::call_guard<py::gil_scoped_release>())
         .def("get_cf", &PyRocksDBExtended::get_cf, py::arg("cf_handle"), py::arg("key"), py::arg("read_options") = nullptr, "Retrieves the value for a key from a specific column family.")
+        .def("get_equals_cf", &PyRocksDBExtended::get_equals_cf, py::arg("cf_handle"), py::arg("key"), py::arg("expected"), py::arg("read_options") = nullptr, "Returns True if the key exists in a specific column family and its value equals `expected`.", py::call_guard<py::gil_scoped_release>())
+        .def("put_and_verify_cf", &PyRocksDBExtended::put_and_verify_cf, py::arg("cf_handle"), py::arg("key"), py::arg("value"), py::arg("write_options") = nullptr, py::arg("read_options") = nullptr, "Inserts a key-value pair into a specific column family and reads it back in the same call. Returns True if the read returns `value`.", py::call_guard<py::gil_scoped_release>())
         .def("delete_cf", &PyRocksDBExtended::del_cf, py::arg("cf_handle"), py::arg("key"), py::arg("write_options") = nullptr, "Deletes a key from a specific column family.", py::call_guard<py::gil_scoped_release>())
         .def("list_column_families", &PyRocksDBExtended::list_column_families, "Lists the names of all existing column families.")
+        .def("list_column_families_set", &PyRocksDBExtended::list_column_families_set, "Returns the names of all existing column families as a frozenset.")
         .def("create_column_family", &PyRocksDBExtended::create_column_family, py::arg("name"), py::arg("cf_options") = nullptr, "Creates a new column family.", py::call_guard<py::gil_scoped_release>())
         .def("drop_column_family", &PyRocksDBExtended::drop_column_family, py::arg("cf_handle"), "Drops a column family.", py::call_guard<py::gil_scoped_release>())
-        .def("new_cf_iterator", &PyRocksDBExtended::new_cf_iterator, py::arg("cf_handle"), py::arg("read_options") = nullptr, "Creates a new iterator for a specific column family.", py::keep_alive<0, 1>())
+        .def("new_cf_iterator", &PyRocksDBExtended::new_cf_iterator, py::arg("cf_handle"), py::arg("read_options") = nullptr, "Creates a new iterator for a specific column family.", py::keep_alive<0, 1>(), py::call_guard<py::gil_scoped_release>())
+        .def("scan_keys_cf", &PyRocksDBExtended::scan_keys_cf, py::arg("cf_handle"), py::arg("lower") = py::none(), py::arg("upper") = py::none(), py::arg("read_options") = nullptr, "Returns the keys in [lower, upper) of a specific column family as a list of bytes, in one call.")
+        .def("scan_items_cf", &PyRocksDBExtended::scan_items_cf, py::arg("cf_handle"), py::arg("lower") = py::none(), py::arg("upper") = py::none(), py::arg("read_options") = nullptr, "Returns the entries in [lower, upper) of a specific column family as a list of (key, value) bytes tuples, in one call.")
         .def("get_column_family", &PyRocksDBExtended::get_column_family, py::arg("name"), "Retrieves a ColumnFamilyHandle by its name.")
         .def_property_readonly("default_cf", &PyRocksDBExtended::get_default_cf, "Returns the handle for the default column family.");
 }
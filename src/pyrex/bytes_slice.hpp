@@ -0,0 +1,17 @@
+#pragma once
+
+#include <cstddef>
+
+#include <pybind11/pybind11.h>
+
+#include "rocksdb/slice.h"
+
+namespace py = pybind11;
+
+// Views the buffer of a Python bytes object as a RocksDB slice, without copying it.
+// The slice is only valid while `bytes` is alive. pybind11 has already type-checked
+// py::bytes arguments, so the unchecked accessors are safe, and, since they are plain
+// field reads, they can also be used by bindings that run with the GIL released.
+inline rocksdb::Slice to_slice(const py::bytes& bytes) {
+    return rocksdb::Slice(PyBytes_AS_STRING(bytes.ptr()), static_cast<size_t>(PyBytes_GET_SIZE(bytes.ptr())));
+}
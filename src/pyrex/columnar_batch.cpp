@@ -66,26 +66,66 @@ ByteColumn extract_arrow_array(const py::object& input, const char* name) {
     py::buffer_info offsets_info = offsets_buffer.request();
     py::buffer_info data_info = data_buffer.request();
 
+    // Sliced arrays (e.g. chunked ingestion via array.slice()) share the parent's buffers;
+    // the slice offset selects where this array's offsets start.
+    size_t array_offset = 0;
+    if (py::hasattr(input, "offset")) {
+        array_offset = input.attr("offset").cast<size_t>();
+    }
+    const size_t offsets_needed = array_offset + column.length_ + 1;
+
     column.data_ = static_cast<const char*>(data_info.ptr);
     if (column.offset_width_ == ByteColumn::OffsetWidth::Int32) {
-        if (offsets_info.size * offsets_info.itemsize < static_cast<ssize_t>((column.length_ + 1) * sizeof(int32_t))) {
+        if (offsets_info.size * offsets_info.itemsize < static_cast<ssize_t>(offsets_needed * sizeof(int32_t))) {
             throw py::value_error(std::string(name) + " Arrow offsets buffer is too small");
         }
-        column.offsets32_ = static_cast<const int32_t*>(offsets_info.ptr);
+        column.offsets32_ = static_cast<const int32_t*>(offsets_info.ptr) + array_offset;
     } else {
-        if (offsets_info.size * offsets_info.itemsize < static_cast<ssize_t>((column.length_ + 1) * sizeof(int64_t))) {
+        if (offsets_info.size * offsets_info.itemsize < static_cast<ssize_t>(offsets_needed * sizeof(int64_t))) {
             throw py::value_error(std::string(name) + " Arrow offsets buffer is too small");
         }
-        column.offsets64_ = static_cast<const int64_t*>(offsets_info.ptr);
+        column.offsets64_ = static_cast<const int64_t*>(offsets_info.ptr) + array_offset;
     }
 
     return column;
 }
 
+bool is_numpy_bytes_array(const py::object& input) {
+    if (!py::hasattr(input, "dtype") || !py::hasattr(input, "ndim")) {
+        return false;
+    }
+    return py::str(input.attr("dtype").attr("kind")).cast<std::string>() == "S";
+}
+
+ByteColumn extract_fixed_width_array(const py::object& input, const char* name) {
+    ByteColumn column;
+    column.owner_ = input;
+
+    // NumPy ``S<n>`` arrays store every row in exactly n bytes of one buffer, so rows are
+    // addressed by stride instead of being copied into Python bytes objects.
+    py::buffer buffer(input);
+    py::buffer_info info = buffer.request();
+    if (info.ndim != 1) {
+        throw py::value_error(std::string(name) + " NumPy array must be one-dimensional");
+    }
+    if (info.strides[0] != info.itemsize) {
+        throw py::value_error(std::string(name) + " NumPy array must be contiguous");
+    }
+
+    column.data_owner_ = input;
+    column.data_ = static_cast<const char*>(info.ptr);
+    column.length_ = static_cast<size_t>(info.shape[0]);
+    column.item_size_ = static_cast<size_t>(info.itemsize);
+    return column;
+}
+
 }  // namespace
 
 std::string_view ByteColumn::value(size_t index) const {
-    if (!fallback_values_.empty() || offset_width_ == OffsetWidth::Fixed) {
+    if (offset_width_ == OffsetWidth::Fixed) {
+        if (data_ != nullptr) {
+            return std::string_view(data_ + index * item_size_, item_size_);
+        }
         return fallback_values_[index];
     }
 
@@ -105,9 +145,13 @@ ByteColumn extract_byte_column(const py::object& input, const char* name) {
         return extract_sequence(input, name);
     }
 
+    if (is_numpy_bytes_array(input)) {
+        return extract_fixed_width_array(input, name);
+    }
+
     if (py::hasattr(input, "buffers") && py::hasattr(input, "type") && py::hasattr(input, "null_count")) {
         return extract_arrow_array(input, name);
     }
 
-    throw py::type_error(std::string(name) + " must be an Arrow binary/string array or a sequence of bytes");
+    throw py::type_error(std::string(name) + " must be an Arrow binary/string array, a NumPy bytes (S) array, or a sequence of bytes");
 }
@@ -21,6 +21,8 @@ public:
     const int32_t* offsets32_ = nullptr;
     const int64_t* offsets64_ = nullptr;
     size_t length_ = 0;
+    // Row width for fixed-width buffers (NumPy ``S`` arrays); unused for other inputs.
+    size_t item_size_ = 0;
     OffsetWidth offset_width_ = OffsetWidth::Fixed;
 
     std::string_view value(size_t index) const;
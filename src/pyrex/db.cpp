@@ -1,5 +1,6 @@
 #include "db.hpp"
 
+#include "bytes_slice.hpp"
 #include "columnar_batch.hpp"
 #include "exceptions.hpp"
 #include "iterator.hpp"
@@ -44,13 +45,14 @@ PyRocksDB::PyRocksDB(const std::string& path, PyOptions* py_options, bool read_o
 PyRocksDB::~PyRocksDB() { close(); }
 
 void PyRocksDB::check_db_open() const {
-    if (is_closed_ || db_ == nullptr) {
+    if (is_closed_.load(std::memory_order_acquire) || db_ == nullptr) {
         throw RocksDBException("Database is not open or has been closed.");
     }
 }
 
 void PyRocksDB::check_read_only() const {
-    if (is_read_only_.load()) {
+    // Only ever set while the DB is being constructed, so no ordering is needed.
+    if (is_read_only_.load(std::memory_order_relaxed)) {
         throw RocksDBException("Cannot perform put/write/delete operation: Database opened in read-only mode.");
     }
 }
@@ -63,14 +65,26 @@ rocksdb::ColumnFamilyHandle* PyRocksDB::get_default_cf_handle() const {
     return it->second->cf_handle_;
 }
 
+std::shared_ptr<PyReadOptions> PyRocksDB::resolve_read_options(const std::shared_ptr<PyReadOptions>& read_options) const {
+    return read_options ? read_options : default_read_options_;
+}
+
+std::shared_ptr<PyWriteOptions> PyRocksDB::resolve_write_options(const std::shared_ptr<PyWriteOptions>& write_options) const {
+    return write_options ? write_options : default_write_options_;
+}
+
 void PyRocksDB::close() {
-    if (!is_closed_.exchange(true)) {
+    if (!is_closed_.exchange(true, std::memory_order_acq_rel)) {
         {
             std::lock_guard<std::mutex> lock(active_iterators_mutex_);
-            for (rocksdb::Iterator* iter_raw_ptr : active_rocksdb_iterators_) {
+            for (auto const& [iter_raw_ptr, key] : active_rocksdb_iterators_) {
                 delete iter_raw_ptr;
             }
             active_rocksdb_iterators_.clear();
+            for (auto const& [key, iter_raw_ptr] : iterator_pool_) {
+                delete iter_raw_ptr;
+            }
+            iterator_pool_.clear();
         }
         for (auto const& [name, handle_ptr] : cf_handles_) {
             handle_ptr->cf_handle_ = nullptr;
@@ -87,45 +101,114 @@ void PyRocksDB::put(const py::bytes& key, const py::bytes& value, std::shared_pt
     check_db_open();
     check_read_only();
 
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    rocksdb::Slice value_slice(static_cast<std::string_view>(value));
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
 
-    const auto& opts = write_options ? write_options->options_ : default_write_options_->options_;
-    rocksdb::Status s = db_->Put(opts, default_cf_handle_, key_slice, value_slice);
+    const auto opts = resolve_write_options(write_options);
+    rocksdb::Status s = db_->Put(opts->options_, default_cf_handle_, key_slice, value_slice);
     if (!s.ok()) throw RocksDBException("Put failed: " + s.ToString());
 }
 
 py::object PyRocksDB::get(const py::bytes& key, std::shared_ptr<PyReadOptions> read_options) {
     check_db_open();
-    std::string value_str;
+    // A PinnableSlice can point straight into a block-cache block, so a cache hit is
+    // copied once, into the returned bytes, instead of going through a std::string first.
+    rocksdb::PinnableSlice value;
     rocksdb::Status s;
 
-    const auto& opts = read_options ? read_options->options_ : default_read_options_->options_;
+    const auto opts = resolve_read_options(read_options);
 
     {
         py::gil_scoped_release release;
-        rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-        s = db_->Get(opts, default_cf_handle_, key_slice, &value_str);
+        rocksdb::Slice key_slice = to_slice(key);
+        s = db_->Get(opts->options_, default_cf_handle_, key_slice, &value);
     }
-    if (s.ok()) return py::bytes(value_str);
+    if (s.ok()) return py::bytes(value.data(), value.size());
     if (s.IsNotFound()) return py::none();
     throw RocksDBException("Get failed: " + s.ToString());
 }
 
+bool PyRocksDB::put_and_verify_in(rocksdb::ColumnFamilyHandle* cf, const py::bytes& key, const py::bytes& value,
+                                  const std::shared_ptr<PyWriteOptions>& write_options, const std::shared_ptr<PyReadOptions>& read_options) {
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
+
+    rocksdb::Status s = db_->Put(resolve_write_options(write_options)->options_, cf, key_slice, value_slice);
+    if (!s.ok()) throw RocksDBException("Put failed: " + s.ToString());
+
+    rocksdb::PinnableSlice stored;
+    s = db_->Get(resolve_read_options(read_options)->options_, cf, key_slice, &stored);
+    if (s.IsNotFound()) return false;
+    if (!s.ok()) throw RocksDBException("Get failed: " + s.ToString());
+    return stored == value_slice;
+}
+
+bool PyRocksDB::put_and_verify(const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    check_read_only();
+    return put_and_verify_in(default_cf_handle_, key, value, write_options, read_options);
+}
+
+bool PyRocksDB::get_equals_in(rocksdb::ColumnFamilyHandle* cf, const py::bytes& key, const py::bytes& expected,
+                              const std::shared_ptr<PyReadOptions>& read_options) {
+    // The PinnableSlice is compared in place, so a block-cache hit is not copied at all.
+    rocksdb::PinnableSlice value;
+    rocksdb::Status s = db_->Get(resolve_read_options(read_options)->options_, cf, to_slice(key), &value);
+    if (s.IsNotFound()) return false;
+    if (!s.ok()) throw RocksDBException("Get failed: " + s.ToString());
+    return value == to_slice(expected);
+}
+
+bool PyRocksDB::get_equals(const py::bytes& key, const py::bytes& expected, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    return get_equals_in(default_cf_handle_, key, expected, read_options);
+}
+
+py::list PyRocksDB::multi_get(const std::vector<py::bytes>& keys, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    const auto opts = resolve_read_options(read_options);
+
+    // The slices point into the caller's bytes objects, which `keys` keeps alive.
+    std::vector<rocksdb::Slice> key_slices;
+    key_slices.reserve(keys.size());
+    for (const auto& key : keys) {
+        key_slices.push_back(to_slice(key));
+    }
+    std::vector<rocksdb::PinnableSlice> values(keys.size());
+    std::vector<rocksdb::Status> statuses(keys.size());
+
+    {
+        py::gil_scoped_release release;
+        db_->MultiGet(opts->options_, default_cf_handle_, key_slices.size(), key_slices.data(), values.data(), statuses.data());
+    }
+
+    py::list result(keys.size());
+    for (size_t i = 0; i < keys.size(); ++i) {
+        if (statuses[i].ok()) {
+            result[i] = py::bytes(values[i].data(), values[i].size());
+        } else if (statuses[i].IsNotFound()) {
+            result[i] = py::none();
+        } else {
+            throw RocksDBException("MultiGet failed: " + statuses[i].ToString());
+        }
+    }
+    return result;
+}
+
 void PyRocksDB::del(const py::bytes& key, std::shared_ptr<PyWriteOptions> write_options) {
     check_db_open();
     check_read_only();
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    const auto& opts = write_options ? write_options->options_ : default_write_options_->options_;
-    rocksdb::Status s = db_->Delete(opts, default_cf_handle_, key_slice);
+    rocksdb::Slice key_slice = to_slice(key);
+    const auto opts = resolve_write_options(write_options);
+    rocksdb::Status s = db_->Delete(opts->options_, default_cf_handle_, key_slice);
     if (!s.ok()) throw RocksDBException("Delete failed: " + s.ToString());
 }
 
 void PyRocksDB::write(PyWriteBatch& batch, std::shared_ptr<PyWriteOptions> write_options) {
     check_db_open();
     check_read_only();
-    const auto& opts = write_options ? write_options->options_ : default_write_options_->options_;
-    rocksdb::Status s = db_->Write(opts, &batch.wb_);
+    const auto opts = resolve_write_options(write_options);
+    rocksdb::Status s = db_->Write(opts->options_, &batch.wb_);
     if (!s.ok()) throw RocksDBException("Write failed: " + s.ToString());
 }
 
@@ -148,7 +231,7 @@ void PyRocksDB::write_columnar_batch(const py::object& keys, const py::object& v
         return;
     }
 
-    const auto opts = write_options ? write_options->options_ : default_write_options_->options_;
+    const auto opts = resolve_write_options(write_options);
     rocksdb::Status s;
     {
         py::gil_scoped_release release;
@@ -160,20 +243,134 @@ void PyRocksDB::write_columnar_batch(const py::object& keys, const py::object& v
             std::string_view value = value_column.value(i);
             batch.Put(rocksdb::Slice(key.data(), key.size()), rocksdb::Slice(value.data(), value.size()));
         }
-        s = db_->Write(opts, &batch);
+        s = db_->Write(opts->options_, &batch);
     }
     if (!s.ok()) throw RocksDBException("Write columnar batch failed: " + s.ToString());
 }
 
 std::shared_ptr<PyRocksDBIterator> PyRocksDB::new_iterator(std::shared_ptr<PyReadOptions> read_options) {
     check_db_open();
-    const auto& opts = read_options ? read_options->options_ : default_read_options_->options_;
-    rocksdb::Iterator* raw_iter = db_->NewIterator(opts, default_cf_handle_);
+    const auto opts = resolve_read_options(read_options);
+    rocksdb::Iterator* raw_iter = acquire_iterator(opts->options_, default_cf_handle_);
+    return std::make_shared<PyRocksDBIterator>(raw_iter, shared_from_this());
+}
+
+rocksdb::Iterator* PyRocksDB::acquire_iterator(const rocksdb::ReadOptions& read_options, rocksdb::ColumnFamilyHandle* cf) {
+    const IteratorPoolKey key{cf, read_options.fill_cache, read_options.verify_checksums};
+    std::lock_guard<std::mutex> lock(active_iterators_mutex_);
+    for (auto pooled = iterator_pool_.begin(); pooled != iterator_pool_.end(); ++pooled) {
+        if (pooled->first == key) {
+            rocksdb::Iterator* raw_iter = pooled->second;
+            iterator_pool_.erase(pooled);
+            // Refresh() re-reads the latest data and leaves the iterator unpositioned, like a new one.
+            if (raw_iter->Refresh().ok()) {
+                active_rocksdb_iterators_.emplace(raw_iter, key);
+                return raw_iter;
+            }
+            delete raw_iter;
+            break;
+        }
+    }
+    rocksdb::Iterator* raw_iter = db_->NewIterator(read_options, cf);
+    active_rocksdb_iterators_.emplace(raw_iter, key);
+    return raw_iter;
+}
+
+void PyRocksDB::release_iterator(rocksdb::Iterator* iterator) {
+    // A pooled iterator pins the data it last read (memtables and SST files) until it is reused,
+    // so the pool stays small.
+    constexpr size_t kMaxPooledIterators = 4;
+    std::lock_guard<std::mutex> lock(active_iterators_mutex_);
+    auto active = active_rocksdb_iterators_.find(iterator);
+    if (active == active_rocksdb_iterators_.end()) return;  // Already deleted by close().
+    const std::optional<IteratorPoolKey> key = active->second;
+    active_rocksdb_iterators_.erase(active);
+    if (!key || !iterator->status().ok()) {
+        delete iterator;
+        return;
+    }
+    // A full pool gives up its oldest entry, so entries that are never asked for again
+    // (e.g. for rarely used read options) cannot keep pooling disabled.
+    if (iterator_pool_.size() >= kMaxPooledIterators) {
+        delete iterator_pool_.front().second;
+        iterator_pool_.erase(iterator_pool_.begin());
+    }
+    iterator_pool_.emplace_back(*key, iterator);
+}
+
+void PyRocksDB::discard_pooled_iterators(rocksdb::ColumnFamilyHandle* cf) {
+    std::lock_guard<std::mutex> lock(active_iterators_mutex_);
+    std::erase_if(iterator_pool_, [cf](const auto& pooled) {
+        if (pooled.first.cf != cf) return false;
+        delete pooled.second;
+        return true;
+    });
+    for (auto& [iter_raw_ptr, key] : active_rocksdb_iterators_) {
+        if (key && key->cf == cf) key.reset();
+    }
+}
+
+py::list PyRocksDB::scan(rocksdb::ColumnFamilyHandle* cf, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper,
+                         const std::shared_ptr<PyReadOptions>& read_options, bool with_values) {
+    rocksdb::ReadOptions options = resolve_read_options(read_options)->options_;
+    rocksdb::Slice lower_slice;
+    rocksdb::Slice upper_slice;
+    if (lower) {
+        lower_slice = to_slice(*lower);
+        options.iterate_lower_bound = &lower_slice;
+    }
+    if (upper) {
+        upper_slice = to_slice(*upper);
+        options.iterate_upper_bound = &upper_slice;
+    }
+
+    // The scan runs without the GIL and copies each entry into one buffer; the Python objects
+    // are built afterwards in a single pass, instead of a GIL round trip per entry.
+    std::string buffer;
+    std::vector<size_t> ends;  // End offset in `buffer` of each key (and value, if with_values).
+    rocksdb::Status s;
     {
-        std::lock_guard<std::mutex> lock(active_iterators_mutex_);
-        active_rocksdb_iterators_.insert(raw_iter);
+        py::gil_scoped_release release;
+        std::unique_ptr<rocksdb::Iterator> it(db_->NewIterator(options, cf));
+        for (lower ? it->Seek(lower_slice) : it->SeekToFirst(); it->Valid(); it->Next()) {
+            const rocksdb::Slice key = it->key();
+            buffer.append(key.data(), key.size());
+            ends.push_back(buffer.size());
+            if (with_values) {
+                const rocksdb::Slice value = it->value();
+                buffer.append(value.data(), value.size());
+                ends.push_back(buffer.size());
+            }
+        }
+        s = it->status();
     }
-    return std::make_shared<PyRocksDBIterator>(raw_iter, shared_from_this());
+    if (!s.ok()) throw RocksDBException("Scan failed: " + s.ToString());
+
+    const size_t fields = with_values ? 2 : 1;
+    py::list entries(ends.size() / fields);
+    size_t begin = 0;
+    for (size_t i = 0; i < ends.size(); i += fields) {
+        py::bytes key(buffer.data() + begin, ends[i] - begin);
+        begin = ends[i];
+        if (with_values) {
+            py::bytes value(buffer.data() + begin, ends[i + 1] - begin);
+            begin = ends[i + 1];
+            entries[i / fields] = py::make_tuple(std::move(key), std::move(value));
+        } else {
+            entries[i] = std::move(key);
+        }
+    }
+    return entries;
+}
+
+py::list PyRocksDB::scan_keys(const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    return scan(default_cf_handle_, lower, upper, read_options, false);
+}
+
+py::list PyRocksDB::scan_items(const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    return scan(default_cf_handle_, lower, upper, read_options, true);
 }
 
 PyOptions PyRocksDB::get_options() const { return opened_options_; }
@@ -254,32 +451,50 @@ void PyRocksDBExtended::put_cf(PyColumnFamilyHandle& cf, const py::bytes& key, c
     check_db_open();
     check_read_only();
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    rocksdb::Slice value_slice(static_cast<std::string_view>(value));
-    const auto& opts = write_options ? write_options->options_ : default_write_options_->options_;
-    rocksdb::Status s = db_->Put(opts, cf.cf_handle_, key_slice, value_slice);
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
+    const auto opts = resolve_write_options(write_options);
+    rocksdb::Status s = db_->Put(opts->options_, cf.cf_handle_, key_slice, value_slice);
     if (!s.ok()) throw RocksDBException("put_cf failed: " + s.ToString());
 }
 
 py::object PyRocksDBExtended::get_cf(PyColumnFamilyHandle& cf, const py::bytes& key, std::shared_ptr<PyReadOptions> read_options) {
     check_db_open();
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    std::string value_str;
-    const auto& opts = read_options ? read_options->options_ : default_read_options_->options_;
-    rocksdb::Status s = db_->Get(opts, cf.cf_handle_, key_slice, &value_str);
-    if (s.ok()) return py::bytes(value_str);
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::PinnableSlice value;
+    rocksdb::Status s;
+    const auto opts = resolve_read_options(read_options);
+    {
+        // Cold-cache reads can block on disk; let other Python threads run meanwhile.
+        py::gil_scoped_release release;
+        s = db_->Get(opts->options_, cf.cf_handle_, key_slice, &value);
+    }
+    if (s.ok()) return py::bytes(value.data(), value.size());
     if (s.IsNotFound()) return py::none();
     throw RocksDBException("get_cf failed: " + s.ToString());
 }
 
+bool PyRocksDBExtended::get_equals_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& expected, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    return get_equals_in(cf.cf_handle_, key, expected, read_options);
+}
+
+bool PyRocksDBExtended::put_and_verify_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    check_read_only();
+    if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    return put_and_verify_in(cf.cf_handle_, key, value, write_options, read_options);
+}
+
 void PyRocksDBExtended::del_cf(PyColumnFamilyHandle& cf, const py::bytes& key, std::shared_ptr<PyWriteOptions> write_options) {
     check_db_open();
     check_read_only();
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    const auto& opts = write_options ? write_options->options_ : default_write_options_->options_;
-    rocksdb::Status s = db_->Delete(opts, cf.cf_handle_, key_slice);
+    rocksdb::Slice key_slice = to_slice(key);
+    const auto opts = resolve_write_options(write_options);
+    rocksdb::Status s = db_->Delete(opts->options_, cf.cf_handle_, key_slice);
     if (!s.ok()) throw RocksDBException("del_cf failed: " + s.ToString());
 }
 
@@ -292,6 +507,17 @@ std::vector<std::string> PyRocksDBExtended::list_column_families() {
     return names;
 }
 
+py::frozenset PyRocksDBExtended::list_column_families_set() {
+    check_db_open();
+    // A frozenset may be filled with PySet_Add until it is shared, so it is built in one pass.
+    auto names = py::reinterpret_steal<py::frozenset>(PyFrozenSet_New(nullptr));
+    if (!names) throw py::error_already_set();
+    for (const auto& pair : cf_handles_) {
+        if (PySet_Add(names.ptr(), py::str(pair.first).ptr()) != 0) throw py::error_already_set();
+    }
+    return names;
+}
+
 std::shared_ptr<PyColumnFamilyHandle> PyRocksDBExtended::create_column_family(const std::string& name, PyOptions* cf_py_options) {
     check_db_open();
     check_read_only();
@@ -320,6 +546,9 @@ void PyRocksDBExtended::drop_column_family(PyColumnFamilyHandle& cf_handle) {
     rocksdb::Status s = db_->DropColumnFamily(raw_handle);
     if (!s.ok()) throw RocksDBException("Failed to drop column family '" + cf_name + "': " + s.ToString());
 
+    // A later handle may get the same address, so no pooled iterator may be keyed by this one.
+    discard_pooled_iterators(raw_handle);
+
     s = db_->DestroyColumnFamilyHandle(raw_handle);
     if (!s.ok()) throw RocksDBException("Dropped CF but failed to destroy handle: " + s.ToString());
 
@@ -342,11 +571,25 @@ std::shared_ptr<PyRocksDBIterator> PyRocksDBExtended::new_cf_iterator(PyColumnFa
     check_db_open();
     if (!cf_handle.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
 
-    const auto& opts = read_options ? read_options->options_ : default_read_options_->options_;
-    rocksdb::Iterator* raw_iter = db_->NewIterator(opts, cf_handle.cf_handle_);
-    {
-        std::lock_guard<std::mutex> lock(active_iterators_mutex_);
-        active_rocksdb_iterators_.insert(raw_iter);
-    }
+    const auto opts = resolve_read_options(read_options);
+    rocksdb::Iterator* raw_iter = acquire_iterator(opts->options_, cf_handle.cf_handle_);
     return std::make_shared<PyRocksDBIterator>(raw_iter, shared_from_this());
 }
+
+py::list PyRocksDBExtended::scan_keys_cf(PyColumnFamilyHandle& cf_handle, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    if (!cf_handle.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    return scan(cf_handle.cf_handle_, lower, upper, read_options, false);
+}
+
+py::list PyRocksDBExtended::scan_items_cf(PyColumnFamilyHandle& cf_handle, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options) {
+    check_db_open();
+    if (!cf_handle.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    return scan(cf_handle.cf_handle_, lower, upper, read_options, true);
+}
+
+void destroy_db(const std::string& path, PyOptions* py_options) {
+    const rocksdb::Options options = py_options ? py_options->options_ : rocksdb::Options();
+    rocksdb::Status s = rocksdb::DestroyDB(path, options);
+    if (!s.ok()) throw RocksDBException("Failed to destroy DB at " + path + ": " + s.ToString());
+}
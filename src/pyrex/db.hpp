@@ -4,8 +4,9 @@
 #include <map>
 #include <memory>
 #include <mutex>
-#include <set>
+#include <optional>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include <pybind11/pybind11.h>
@@ -19,6 +20,16 @@ namespace py = pybind11;
 class PyRocksDBIterator;
 class PyWriteBatch;
 
+// Everything an iterator was created with that Python can vary: iterators are only
+// reused for the same column family and read options.
+struct IteratorPoolKey {
+    rocksdb::ColumnFamilyHandle* cf = nullptr;
+    bool fill_cache = true;
+    bool verify_checksums = true;
+
+    bool operator==(const IteratorPoolKey&) const = default;
+};
+
 class PyRocksDB : public std::enable_shared_from_this<PyRocksDB> {
 protected:
     rocksdb::DB* db_ = nullptr;
@@ -29,7 +40,12 @@ protected:
     std::atomic<bool> is_closed_{false};
     std::atomic<bool> is_read_only_{false};
     std::mutex active_iterators_mutex_;
-    std::set<rocksdb::Iterator*> active_rocksdb_iterators_;
+    // No key means the iterator is deleted rather than pooled once its wrapper goes away
+    // (its column family was dropped while it was in use).
+    std::map<rocksdb::Iterator*, std::optional<IteratorPoolKey>> active_rocksdb_iterators_;
+    // Iterators whose Python wrapper was freed, kept for reuse, oldest first; guarded by
+    // active_iterators_mutex_.
+    std::vector<std::pair<IteratorPoolKey, rocksdb::Iterator*>> iterator_pool_;
     std::shared_ptr<PyReadOptions> default_read_options_;
     std::shared_ptr<PyWriteOptions> default_write_options_;
 
@@ -38,6 +54,25 @@ protected:
     void check_db_open() const;
     void check_read_only() const;
     rocksdb::ColumnFamilyHandle* get_default_cf_handle() const;
+    // The caller's options, or the DB defaults. Returning the shared_ptr keeps them alive
+    // while the GIL is released, even if the defaults are replaced from Python meanwhile.
+    std::shared_ptr<PyReadOptions> resolve_read_options(const std::shared_ptr<PyReadOptions>& read_options) const;
+    std::shared_ptr<PyWriteOptions> resolve_write_options(const std::shared_ptr<PyWriteOptions>& write_options) const;
+    // A pooled iterator for the same column family and options, refreshed to the latest data,
+    // or a new one; registered as active either way.
+    rocksdb::Iterator* acquire_iterator(const rocksdb::ReadOptions& read_options, rocksdb::ColumnFamilyHandle* cf);
+    // Called when an iterator's Python wrapper goes away: pools the iterator or deletes it.
+    void release_iterator(rocksdb::Iterator* iterator);
+    // Called before `cf` is destroyed: deletes its pooled iterators and keeps its active ones
+    // from being pooled, so that no pool entry refers to the freed handle.
+    void discard_pooled_iterators(rocksdb::ColumnFamilyHandle* cf);
+    bool put_and_verify_in(rocksdb::ColumnFamilyHandle* cf, const py::bytes& key, const py::bytes& value,
+                           const std::shared_ptr<PyWriteOptions>& write_options, const std::shared_ptr<PyReadOptions>& read_options);
+    bool get_equals_in(rocksdb::ColumnFamilyHandle* cf, const py::bytes& key, const py::bytes& expected,
+                       const std::shared_ptr<PyReadOptions>& read_options);
+    // Reads [lower, upper) of `cf` in one call: a list of keys, or of (key, value) tuples.
+    py::list scan(rocksdb::ColumnFamilyHandle* cf, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper,
+                  const std::shared_ptr<PyReadOptions>& read_options, bool with_values);
 
 public:
     PyRocksDB();
@@ -47,10 +82,17 @@ public:
     void close();
     void put(const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options = nullptr);
     py::object get(const py::bytes& key, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    // Put followed by a Get of the same key, in one call; true if the Get returns `value`.
+    bool put_and_verify(const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options = nullptr, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    // True if `key` exists and its value equals `expected`; the value is never copied into Python.
+    bool get_equals(const py::bytes& key, const py::bytes& expected, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    py::list multi_get(const std::vector<py::bytes>& keys, std::shared_ptr<PyReadOptions> read_options = nullptr);
     void del(const py::bytes& key, std::shared_ptr<PyWriteOptions> write_options = nullptr);
     void write(PyWriteBatch& batch, std::shared_ptr<PyWriteOptions> write_options = nullptr);
     void write_columnar_batch(const py::object& keys, const py::object& values, std::shared_ptr<PyWriteOptions> write_options = nullptr, const std::string& on_null = "error");
     std::shared_ptr<PyRocksDBIterator> new_iterator(std::shared_ptr<PyReadOptions> read_options = nullptr);
+    py::list scan_keys(const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    py::list scan_items(const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options = nullptr);
     PyOptions get_options() const;
     std::shared_ptr<PyReadOptions> get_default_read_options();
     void set_default_read_options(std::shared_ptr<PyReadOptions> opts);
@@ -58,17 +100,26 @@ public:
     void set_default_write_options(std::shared_ptr<PyWriteOptions> opts);
 };
 
+// Deletes the database at `path` (which must not be open) and its directory.
+void destroy_db(const std::string& path, PyOptions* py_options = nullptr);
+
 class PyRocksDBExtended : public PyRocksDB {
 public:
     PyRocksDBExtended(const std::string& path, PyOptions* py_options, bool read_only = false);
 
     void put_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options = nullptr);
     py::object get_cf(PyColumnFamilyHandle& cf, const py::bytes& key, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    bool get_equals_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& expected, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    bool put_and_verify_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value, std::shared_ptr<PyWriteOptions> write_options = nullptr, std::shared_ptr<PyReadOptions> read_options = nullptr);
     void del_cf(PyColumnFamilyHandle& cf, const py::bytes& key, std::shared_ptr<PyWriteOptions> write_options = nullptr);
     std::vector<std::string> list_column_families();
+    // The same names as a frozenset, for membership checks.
+    py::frozenset list_column_families_set();
     std::shared_ptr<PyColumnFamilyHandle> create_column_family(const std::string& name, PyOptions* cf_py_options = nullptr);
     void drop_column_family(PyColumnFamilyHandle& cf_handle);
     std::shared_ptr<PyColumnFamilyHandle> get_column_family(const std::string& name);
     std::shared_ptr<PyColumnFamilyHandle> get_default_cf();
     std::shared_ptr<PyRocksDBIterator> new_cf_iterator(PyColumnFamilyHandle& cf_handle, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    py::list scan_keys_cf(PyColumnFamilyHandle& cf_handle, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options = nullptr);
+    py::list scan_items_cf(PyColumnFamilyHandle& cf_handle, const std::optional<py::bytes>& lower, const std::optional<py::bytes>& upper, std::shared_ptr<PyReadOptions> read_options = nullptr);
 };
@@ -1,9 +1,13 @@
 #include "iterator.hpp"
 
+#include <cstdint>
 #include <string>
+#include <vector>
 
+#include "bytes_slice.hpp"
 #include "db.hpp"
 #include "exceptions.hpp"
+#include "rocksdb/slice.h"
 #include "rocksdb/status.h"
 
 PyRocksDBIterator::PyRocksDBIterator(rocksdb::Iterator* it, std::shared_ptr<PyRocksDB> parent_db)
@@ -14,18 +18,16 @@ PyRocksDBIterator::PyRocksDBIterator(rocksdb::Iterator* it, std::shared_ptr<PyRo
 }
 
 PyRocksDBIterator::~PyRocksDBIterator() {
-    if (parent_db_ptr_) {
-        std::lock_guard<std::mutex> lock(parent_db_ptr_->active_iterators_mutex_);
-        if (it_raw_ptr_ && parent_db_ptr_->active_rocksdb_iterators_.count(it_raw_ptr_)) {
-            parent_db_ptr_->active_rocksdb_iterators_.erase(it_raw_ptr_);
-            delete it_raw_ptr_;
-        }
+    if (parent_db_ptr_ && it_raw_ptr_) {
+        parent_db_ptr_->release_iterator(it_raw_ptr_);
     }
     it_raw_ptr_ = nullptr;
 }
 
 void PyRocksDBIterator::check_parent_db_is_open() const {
-    if (!parent_db_ptr_ || parent_db_ptr_->is_closed_.load()) {
+    // Lock-free on the per-step hot path: an acquire load pairs with the release in
+    // PyRocksDB::close(), so a closed DB is always observed here before its iterators go away.
+    if (!parent_db_ptr_ || parent_db_ptr_->is_closed_.load(std::memory_order_acquire)) {
         throw RocksDBException("Database is closed.");
     }
 }
@@ -33,14 +35,17 @@ void PyRocksDBIterator::check_parent_db_is_open() const {
 bool PyRocksDBIterator::valid() { check_parent_db_is_open(); return it_raw_ptr_->Valid(); }
 void PyRocksDBIterator::seek_to_first() { check_parent_db_is_open(); it_raw_ptr_->SeekToFirst(); }
 void PyRocksDBIterator::seek_to_last() { check_parent_db_is_open(); it_raw_ptr_->SeekToLast(); }
-void PyRocksDBIterator::seek(const py::bytes& key) { check_parent_db_is_open(); it_raw_ptr_->Seek(static_cast<std::string>(key)); }
+void PyRocksDBIterator::seek(const py::bytes& key) { check_parent_db_is_open(); it_raw_ptr_->Seek(to_slice(key)); }
 void PyRocksDBIterator::next() { check_parent_db_is_open(); it_raw_ptr_->Next(); }
 void PyRocksDBIterator::prev() { check_parent_db_is_open(); it_raw_ptr_->Prev(); }
 
+// The bytes object is built straight from the iterator's slice; going through
+// Slice::ToString() would copy every key/value twice per step.
 py::object PyRocksDBIterator::key() {
     check_parent_db_is_open();
     if (it_raw_ptr_ && it_raw_ptr_->Valid()) {
-        return py::bytes(it_raw_ptr_->key().ToString());
+        const rocksdb::Slice key = it_raw_ptr_->key();
+        return py::bytes(key.data(), key.size());
     }
     return py::none();
 }
@@ -48,11 +53,52 @@ py::object PyRocksDBIterator::key() {
 py::object PyRocksDBIterator::value() {
     check_parent_db_is_open();
     if (it_raw_ptr_ && it_raw_ptr_->Valid()) {
-        return py::bytes(it_raw_ptr_->value().ToString());
+        const rocksdb::Slice value = it_raw_ptr_->value();
+        return py::bytes(value.data(), value.size());
     }
     return py::none();
 }
 
+bool PyRocksDBIterator::key_equals(const py::bytes& expected) {
+    check_parent_db_is_open();
+    return it_raw_ptr_ && it_raw_ptr_->Valid() && it_raw_ptr_->key() == to_slice(expected);
+}
+
+bool PyRocksDBIterator::value_equals(const py::bytes& expected) {
+    check_parent_db_is_open();
+    return it_raw_ptr_ && it_raw_ptr_->Valid() && it_raw_ptr_->value() == to_slice(expected);
+}
+
+py::list PyRocksDBIterator::collect_keys(std::optional<size_t> limit) {
+    check_parent_db_is_open();
+    // Drains the iterator in one call instead of a valid()/key()/next() round trip per key.
+    // As in PyRocksDB::scan, the keys are copied into one buffer without the GIL and turned
+    // into bytes objects afterwards.
+    std::string buffer;
+    std::vector<size_t> ends;  // End offset in `buffer` of each key.
+    rocksdb::Status s;
+    {
+        py::gil_scoped_release release;
+        const size_t max_keys = limit.value_or(SIZE_MAX);
+        for (size_t n = 0; n < max_keys && it_raw_ptr_->Valid(); ++n) {
+            const rocksdb::Slice key = it_raw_ptr_->key();
+            buffer.append(key.data(), key.size());
+            ends.push_back(buffer.size());
+            it_raw_ptr_->Next();
+        }
+        s = it_raw_ptr_->status();
+    }
+    if (!s.ok()) throw RocksDBException("Iterator error: " + s.ToString());
+
+    py::list keys(ends.size());
+    size_t begin = 0;
+    for (size_t i = 0; i < ends.size(); ++i) {
+        keys[i] = py::bytes(buffer.data() + begin, ends[i] - begin);
+        begin = ends[i];
+    }
+    return keys;
+}
+
 void PyRocksDBIterator::check_status() {
     check_parent_db_is_open();
     if (it_raw_ptr_) {
@@ -1,6 +1,8 @@
 #pragma once
 
+#include <cstddef>
 #include <memory>
+#include <optional>
 
 #include <pybind11/pybind11.h>
 
@@ -27,5 +29,9 @@ public:
     void prev();
     py::object key();
     py::object value();
+    // Compare the current entry against `expected` in place, without copying it into bytes.
+    bool key_equals(const py::bytes& expected);
+    bool value_equals(const py::bytes& expected);
+    py::list collect_keys(std::optional<size_t> limit);
     void check_status();
 };
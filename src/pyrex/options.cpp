@@ -26,19 +26,35 @@ int PyOptions::get_max_open_files() const { return options_.max_open_files; }
 void PyOptions::set_max_open_files(int value) { options_.max_open_files = value; }
 size_t PyOptions::get_write_buffer_size() const { return options_.write_buffer_size; }
 void PyOptions::set_write_buffer_size(size_t value) { options_.write_buffer_size = value; }
+int PyOptions::get_max_write_buffer_number() const { return options_.max_write_buffer_number; }
+void PyOptions::set_max_write_buffer_number(int value) { options_.max_write_buffer_number = value; }
 rocksdb::CompressionType PyOptions::get_compression() const { return options_.compression; }
 void PyOptions::set_compression(rocksdb::CompressionType value) { options_.compression = value; }
 int PyOptions::get_max_background_jobs() const { return options_.max_background_jobs; }
 void PyOptions::set_max_background_jobs(int value) { options_.max_background_jobs = value; }
+bool PyOptions::get_use_direct_reads() const { return options_.use_direct_reads; }
+void PyOptions::set_use_direct_reads(bool value) { options_.use_direct_reads = value; }
+bool PyOptions::get_use_direct_io_for_flush_and_compaction() const { return options_.use_direct_io_for_flush_and_compaction; }
+void PyOptions::set_use_direct_io_for_flush_and_compaction(bool value) { options_.use_direct_io_for_flush_and_compaction = value; }
+uint64_t PyOptions::get_bytes_per_sync() const { return options_.bytes_per_sync; }
+void PyOptions::set_bytes_per_sync(uint64_t value) { options_.bytes_per_sync = value; }
+bool PyOptions::get_optimize_filters_for_hits() const { return options_.optimize_filters_for_hits; }
+void PyOptions::set_optimize_filters_for_hits(bool value) { options_.optimize_filters_for_hits = value; }
 void PyOptions::increase_parallelism(int total_threads) { options_.IncreaseParallelism(total_threads); }
 void PyOptions::optimize_for_small_db() { options_.OptimizeForSmallDb(); }
-void PyOptions::use_block_based_bloom_filter(double bits_per_key) {
+void PyOptions::use_block_based_bloom_filter(double bits_per_key, std::optional<uint32_t> format_version, bool cache_index_and_filter_blocks) {
     rocksdb::BlockBasedTableOptions table_options;
-    table_options.filter_policy.reset(rocksdb::NewBloomFilterPolicy(bits_per_key));
+    // Full (not block-based) filters; with format_version >= 5 these use the
+    // cache-local Bloom layout that probes one cache line per key.
+    table_options.filter_policy.reset(rocksdb::NewBloomFilterPolicy(bits_per_key, false));
+    if (format_version) table_options.format_version = *format_version;
+    table_options.cache_index_and_filter_blocks = cache_index_and_filter_blocks;
     options_.table_factory.reset(rocksdb::NewBlockBasedTableFactory(table_options));
     cf_options_.table_factory.reset(rocksdb::NewBlockBasedTableFactory(table_options));
 }
 size_t PyOptions::get_cf_write_buffer_size() const { return cf_options_.write_buffer_size; }
 void PyOptions::set_cf_write_buffer_size(size_t value) { cf_options_.write_buffer_size = value; }
+int PyOptions::get_cf_max_write_buffer_number() const { return cf_options_.max_write_buffer_number; }
+void PyOptions::set_cf_max_write_buffer_number(int value) { cf_options_.max_write_buffer_number = value; }
 rocksdb::CompressionType PyOptions::get_cf_compression() const { return cf_options_.compression; }
 void PyOptions::set_cf_compression(rocksdb::CompressionType value) { cf_options_.compression = value; }
@@ -1,5 +1,8 @@
 #pragma once
 
+#include <cstdint>
+#include <optional>
+
 #include "rocksdb/options.h"
 
 class PyReadOptions {
@@ -41,15 +44,27 @@ public:
     void set_max_open_files(int value);
     size_t get_write_buffer_size() const;
     void set_write_buffer_size(size_t value);
+    int get_max_write_buffer_number() const;
+    void set_max_write_buffer_number(int value);
     rocksdb::CompressionType get_compression() const;
     void set_compression(rocksdb::CompressionType value);
     int get_max_background_jobs() const;
     void set_max_background_jobs(int value);
+    bool get_use_direct_reads() const;
+    void set_use_direct_reads(bool value);
+    bool get_use_direct_io_for_flush_and_compaction() const;
+    void set_use_direct_io_for_flush_and_compaction(bool value);
+    uint64_t get_bytes_per_sync() const;
+    void set_bytes_per_sync(uint64_t value);
+    bool get_optimize_filters_for_hits() const;
+    void set_optimize_filters_for_hits(bool value);
     void increase_parallelism(int total_threads);
     void optimize_for_small_db();
-    void use_block_based_bloom_filter(double bits_per_key = 10.0);
+    void use_block_based_bloom_filter(double bits_per_key = 10.0, std::optional<uint32_t> format_version = std::nullopt, bool cache_index_and_filter_blocks = false);
     size_t get_cf_write_buffer_size() const;
     void set_cf_write_buffer_size(size_t value);
+    int get_cf_max_write_buffer_number() const;
+    void set_cf_max_write_buffer_number(int value);
     rocksdb::CompressionType get_cf_compression() const;
     void set_cf_compression(rocksdb::CompressionType value);
 };
@@ -0,0 +1,26 @@
+#include "utils.hpp"
+
+#include <charconv>
+#include <cstring>
+
+py::list make_keys(const py::bytes& prefix, size_t n, size_t start, size_t width) {
+    const char* prefix_data = PyBytes_AS_STRING(prefix.ptr());
+    const size_t prefix_size = static_cast<size_t>(PyBytes_GET_SIZE(prefix.ptr()));
+
+    py::list keys(n);
+    char digits[24];
+    for (size_t i = 0; i < n; ++i) {
+        const auto result = std::to_chars(digits, digits + sizeof(digits), start + i);
+        const size_t digit_count = static_cast<size_t>(result.ptr - digits);
+        const size_t padding = width > digit_count ? width - digit_count : 0;
+
+        PyObject* key = PyBytes_FromStringAndSize(nullptr, static_cast<Py_ssize_t>(prefix_size + padding + digit_count));
+        if (!key) throw py::error_already_set();
+        char* out = PyBytes_AS_STRING(key);
+        std::memcpy(out, prefix_data, prefix_size);
+        std::memset(out + prefix_size, '0', padding);
+        std::memcpy(out + prefix_size + padding, digits, digit_count);
+        PyList_SET_ITEM(keys.ptr(), static_cast<Py_ssize_t>(i), key);
+    }
+    return keys;
+}
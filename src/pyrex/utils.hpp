@@ -0,0 +1,11 @@
+#pragma once
+
+#include <cstddef>
+
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+// Returns `prefix + str(i)` as bytes for i in [start, start + n), with the number
+// zero-padded to at least `width` digits. Each key is allocated once, at its final size.
+py::list make_keys(const py::bytes& prefix, size_t n, size_t start = 0, size_t width = 0);
@@ -1,42 +1,127 @@
 #include "write_batch.hpp"
 
 #include <string>
+#include <utility>
+#include <vector>
 
+#include "bytes_slice.hpp"
+#include "columnar_batch.hpp"
 #include "exceptions.hpp"
 #include "rocksdb/slice.h"
 
 void PyWriteBatch::put(const py::bytes& key, const py::bytes& value) {
-    wb_.Put(static_cast<std::string>(key), static_cast<std::string>(value));
+    wb_.Put(to_slice(key), to_slice(value));
 }
 
 void PyWriteBatch::put_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value) {
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    rocksdb::Slice value_slice(static_cast<std::string_view>(value));
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
     wb_.Put(cf.cf_handle_, key_slice, value_slice);
 }
 
+void PyWriteBatch::put_many(const py::object& keys, const py::object& values) {
+    put_columns(nullptr, keys, values);
+}
+
+void PyWriteBatch::put_many_pairs(const py::object& pairs) {
+    put_pairs(nullptr, pairs);
+}
+
+void PyWriteBatch::put_many_cf(PyColumnFamilyHandle& cf, const py::object& keys, const py::object& values) {
+    if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    put_columns(cf.cf_handle_, keys, values);
+}
+
+void PyWriteBatch::put_many_pairs_cf(PyColumnFamilyHandle& cf, const py::object& pairs) {
+    if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    put_pairs(cf.cf_handle_, pairs);
+}
+
+void PyWriteBatch::put_columns(rocksdb::ColumnFamilyHandle* cf, const py::object& keys, const py::object& values) {
+    ByteColumn key_column = extract_byte_column(keys, "keys");
+    ByteColumn value_column = extract_byte_column(values, "values");
+
+    if (key_column.length_ != value_column.length_) {
+        throw py::value_error("keys length " + std::to_string(key_column.length_) + " does not match values length " + std::to_string(value_column.length_));
+    }
+
+    py::gil_scoped_release release;
+    for (size_t i = 0; i < key_column.length_; ++i) {
+        std::string_view key = key_column.value(i);
+        std::string_view value = value_column.value(i);
+        wb_.Put(cf, rocksdb::Slice(key.data(), key.size()), rocksdb::Slice(value.data(), value.size()));
+    }
+}
+
+void PyWriteBatch::put_pairs(rocksdb::ColumnFamilyHandle* cf, const py::object& pairs) {
+    if (!PyList_Check(pairs.ptr()) && !PyTuple_Check(pairs.ptr())) {
+        throw py::type_error("pairs must be a list or tuple of (key, value) bytes tuples");
+    }
+
+    // Everything is validated before the first Put, so a bad pair leaves the batch unchanged.
+    // The slices point into the bytes objects, which stay referenced by `pairs`.
+    const Py_ssize_t count = PySequence_Fast_GET_SIZE(pairs.ptr());
+    PyObject** items = PySequence_Fast_ITEMS(pairs.ptr());
+    std::vector<std::pair<rocksdb::Slice, rocksdb::Slice>> slices;
+    slices.reserve(static_cast<size_t>(count));
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject* pair = items[i];
+        if (!PyTuple_Check(pair) || PyTuple_GET_SIZE(pair) != 2
+            || !PyBytes_Check(PyTuple_GET_ITEM(pair, 0)) || !PyBytes_Check(PyTuple_GET_ITEM(pair, 1))) {
+            throw py::type_error("pairs[" + std::to_string(i) + "] must be a (key, value) tuple of bytes");
+        }
+        slices.emplace_back(to_slice(py::reinterpret_borrow<py::bytes>(PyTuple_GET_ITEM(pair, 0))),
+                            to_slice(py::reinterpret_borrow<py::bytes>(PyTuple_GET_ITEM(pair, 1))));
+    }
+
+    // The GIL stays held: another thread could otherwise shrink `pairs` and free bytes objects
+    // that the slices still point into.
+    for (const auto& [key, value] : slices) {
+        wb_.Put(cf, key, value);
+    }
+}
+
 void PyWriteBatch::del(const py::bytes& key) {
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
+    rocksdb::Slice key_slice = to_slice(key);
     wb_.Delete(key_slice);
 }
 
 void PyWriteBatch::del_cf(PyColumnFamilyHandle& cf, const py::bytes& key) {
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
+    rocksdb::Slice key_slice = to_slice(key);
     wb_.Delete(cf.cf_handle_, key_slice);
 }
 
+void PyWriteBatch::delete_many(const py::object& keys) {
+    delete_keys(nullptr, keys);
+}
+
+void PyWriteBatch::delete_many_cf(PyColumnFamilyHandle& cf, const py::object& keys) {
+    if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
+    delete_keys(cf.cf_handle_, keys);
+}
+
+void PyWriteBatch::delete_keys(rocksdb::ColumnFamilyHandle* cf, const py::object& keys) {
+    ByteColumn key_column = extract_byte_column(keys, "keys");
+
+    py::gil_scoped_release release;
+    for (size_t i = 0; i < key_column.length_; ++i) {
+        std::string_view key = key_column.value(i);
+        wb_.Delete(cf, rocksdb::Slice(key.data(), key.size()));
+    }
+}
+
 void PyWriteBatch::merge(const py::bytes& key, const py::bytes& value) {
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    rocksdb::Slice value_slice(static_cast<std::string_view>(value));
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
     wb_.Merge(key_slice, value_slice);
 }
 
 void PyWriteBatch::merge_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value) {
     if (!cf.is_valid()) throw RocksDBException("ColumnFamilyHandle is invalid.");
-    rocksdb::Slice key_slice(static_cast<std::string_view>(key));
-    rocksdb::Slice value_slice(static_cast<std::string_view>(value));
+    rocksdb::Slice key_slice = to_slice(key);
+    rocksdb::Slice value_slice = to_slice(value);
     wb_.Merge(cf.cf_handle_, key_slice, value_slice);
 }
 
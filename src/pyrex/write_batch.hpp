@@ -11,14 +11,28 @@ class PyWriteBatch {
 public:
     rocksdb::WriteBatch wb_;
 
-    PyWriteBatch() = default;
     // This API batches RocksDB writes but still pays one Python-to-C++ call per put.
     // Arrow-backed serialized batch ingestion can avoid that overhead for columnar chunks.
     void put(const py::bytes& key, const py::bytes& value);
     void put_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value);
+    // Adds many puts in one call; keys/values accept the same inputs as write_columnar_batch.
+    void put_many(const py::object& keys, const py::object& values);
+    // Same, for a list or tuple of (key, value) bytes pairs.
+    void put_many_pairs(const py::object& pairs);
+    void put_many_cf(PyColumnFamilyHandle& cf, const py::object& keys, const py::object& values);
+    void put_many_pairs_cf(PyColumnFamilyHandle& cf, const py::object& pairs);
     void del(const py::bytes& key);
     void del_cf(PyColumnFamilyHandle& cf, const py::bytes& key);
+    // Adds many deletions in one call; keys accept the same inputs as put_many.
+    void delete_many(const py::object& keys);
+    void delete_many_cf(PyColumnFamilyHandle& cf, const py::object& keys);
     void merge(const py::bytes& key, const py::bytes& value);
     void merge_cf(PyColumnFamilyHandle& cf, const py::bytes& key, const py::bytes& value);
     void clear();
+
+private:
+    // A null column family means the default one, as in rocksdb::WriteBatch.
+    void put_columns(rocksdb::ColumnFamilyHandle* cf, const py::object& keys, const py::object& values);
+    void put_pairs(rocksdb::ColumnFamilyHandle* cf, const py::object& pairs);
+    void delete_keys(rocksdb::ColumnFamilyHandle* cf, const py::object& keys);
 };
@@ -2,18 +2,24 @@ import threading
 import time
 import os
 import shutil
+import logging
 import pytest
 import pyrex  # Assuming your compiled module is named pyrex
 
-DB_PATH = "./test_db"
+# Per-worker paths, so that `pytest -n auto` workers never open the same DB directory.
+_WORKER_SUFFIX = f"_{os.environ['PYTEST_XDIST_WORKER']}" if "PYTEST_XDIST_WORKER" in os.environ else ""
+
+DB_PATH = f"./test_db{_WORKER_SUFFIX}"
+
+# Diagnostics; shown with e.g. `pytest --log-level=DEBUG`.
+log = logging.getLogger("pyrex.tests")
 
 # --- Fixture to set up and tear down the database ---
 @pytest.fixture
 def db():
     """A fixture that creates a fresh RocksDB instance for each test."""
-    print("at DB")
-    if os.path.exists(DB_PATH):
-        shutil.rmtree(DB_PATH)
+    log.debug("at DB")
+    shutil.rmtree(DB_PATH, ignore_errors=True)
     # Use PyRocksDBExtended as it covers all functionality
     db_instance = pyrex.PyRocksDBExtended(DB_PATH)
     yield db_instance
@@ -25,6 +31,7 @@ def db():
         # It's okay if the DB is already closed, which some tests do intentionally.
         if "Database is closed" not in str(e):
             raise
+    shutil.rmtree(DB_PATH, ignore_errors=True)
 
 # --- Test Cases ---
 
@@ -37,7 +44,7 @@ def test_iterator_use_after_db_close_segfault(db):
     in Python, but its underlying C++ pointer is now dangling. Accessing
     any of its methods should cause a crash.
     """
-    print("at test_iterator")
+    log.debug("at test_iterator")
     db.put(b"key1", b"value1")
     iterator = db.new_iterator()
     iterator.seek_to_first()
@@ -56,7 +63,7 @@ def test_iterator_use_after_db_close_segfault(db):
     with pytest.raises(pyrex.RocksDBException, match="Database is closed"):
         iterator.next()
         
-    print("\nSUCCESS: test_iterator_use_after_db_close_segfault passed. The wrapper correctly prevented a segfault.")
+    log.debug("SUCCESS: test_iterator_use_after_db_close_segfault passed. The wrapper correctly prevented a segfault.")
 
 
 def test_concurrent_close_and_iterate_deadlock():
@@ -68,9 +75,8 @@ def test_concurrent_close_and_iterate_deadlock():
     garbage collector is destroying iterator objects. This can cause a deadlock
     if the mutex protecting the active iterators list is locked incorrectly.
     """
-    print("at test_concurent")
-    if os.path.exists(DB_PATH):
-        shutil.rmtree(DB_PATH)
+    log.debug("at test_concurent")
+    shutil.rmtree(DB_PATH, ignore_errors=True)
     
     db_instance = pyrex.PyRocksDBExtended(DB_PATH)
     db_instance.put(b"key1", b"value1")
@@ -84,15 +90,15 @@ def test_concurrent_close_and_iterate_deadlock():
         try:
             # Give the other thread a moment to start iterating
             time.sleep(0.1) 
-            print("Thread 1: Closing database...")
+            log.debug("Thread 1: Closing database...")
             db_instance.close()
-            print("Thread 1: Database closed successfully.")
+            log.debug("Thread 1: Database closed successfully.")
         except Exception as e:
             errors.append(f"Close thread failed: {e}")
 
     def iterator_thread_func():
         try:
-            print("Thread 2: Starting iteration...")
+            log.debug("Thread 2: Starting iteration...")
             # This loop will attempt to use the iterator while the other thread closes the DB.
             # It should not hang, but instead raise a RocksDBException.
             for _ in range(5):
@@ -103,11 +109,11 @@ def test_concurrent_close_and_iterate_deadlock():
                         iterator.next()
                         time.sleep(0.05) # Small delay to increase chance of race condition
                 except pyrex.RocksDBException as e:
-                    print(f"Thread 2: Caught expected exception: {e}")
+                    log.debug("Thread 2: Caught expected exception: %s", e)
                     # This is the expected outcome after the DB is closed.
                     assert "Database is closed" in str(e)
                     break # Exit the loop once the DB is closed.
-            print("Thread 2: Iteration finished.")
+            log.debug("Thread 2: Iteration finished.")
         except Exception as e:
             errors.append(f"Iterator thread failed: {e}")
 
@@ -122,11 +128,13 @@ def test_concurrent_close_and_iterate_deadlock():
 
     if t1.is_alive() or t2.is_alive():
         pytest.fail("Deadlock detected! One or more threads did not finish.")
-    
+    # The close thread has finished, so the DB is closed and its directory can go.
+    shutil.rmtree(DB_PATH, ignore_errors=True)
+
     if errors:
         pytest.fail(f"Test failed with errors: {errors}")
 
-    print("\nSUCCESS: test_concurrent_close_and_iterate_deadlock passed without hanging.")
+    log.debug("SUCCESS: test_concurrent_close_and_iterate_deadlock passed without hanging.")
 
 
 def test_use_dropped_column_family_handle(db):
@@ -137,14 +145,14 @@ def test_use_dropped_column_family_handle(db):
     It then tries to use the old handle. The wrapper should throw an exception
     rather than crashing.
     """
-    print("Creating column family 'cf1'...")
+    log.debug("Creating column family 'cf1'...")
     cf_handle = db.create_column_family("cf1")
     assert cf_handle.is_valid()
     
     db.put_cf(cf_handle, b"key_cf", b"value_cf")
     assert db.get_cf(cf_handle, b"key_cf") == b"value_cf"
     
-    print("Dropping column family 'cf1'...")
+    log.debug("Dropping column family 'cf1'...")
     db.drop_column_family(cf_handle)
     
     # The handle is now invalid.
@@ -157,7 +165,7 @@ def test_use_dropped_column_family_handle(db):
     with pytest.raises(pyrex.RocksDBException, match="ColumnFamilyHandle is invalid"):
         db.get_cf(cf_handle, b"key_cf")
 
-    print("\nSUCCESS: test_use_dropped_column_family_handle passed. The wrapper correctly prevented use of a dropped handle.")
+    log.debug("SUCCESS: test_use_dropped_column_family_handle passed. The wrapper correctly prevented use of a dropped handle.")
 
 
 